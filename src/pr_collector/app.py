@@ -2,56 +2,325 @@
 
 from __future__ import annotations
 
+import asyncio
+import mmap
 import os
 import re
+import stat
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
 
-import git
-from github import Github
+import httpx
 
 from . import __version__
+from .cache import cache, ttl_cached
+from .config import DEFAULT_FETCH_DEPTH
+from .ratelimit import rate_limiter
+
+if TYPE_CHECKING:
+    # gitpython is slow to import, so it is only loaded where used
+    import git
 
 PROJECT_NAME = "pr-collector"
 PROJECT_DESCRIPTION = "Collect PR diffs and metadata into markdown files"
 
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+JSON_MEDIA_TYPE = "application/vnd.github+json"
+DIFF_MEDIA_TYPE = "application/vnd.github.v3.diff"
+
+OPEN_PRS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: 100, states: OPEN, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { number title headRefName author { login } createdAt url }
+    }
+  }
+}
+"""
+
+# Fields requested for each aliased pullRequest in batched lookups
+PR_INFO_FIELDS = (
+    "number title body author { login } createdAt updatedAt state baseRefName headRefName url"
+)
+
+BRANCH_PR_QUERY = """
+query($owner: String!, $name: String!, $branch: String!) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: 1, states: OPEN, headRefName: $branch,
+                 orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes { number }
+    }
+  }
+}
+"""
+
+# How long GitHub responses are reused across runs, in seconds
+PR_INFO_TTL = 120
+OPEN_PRS_TTL = 60
+
+# Concurrency cap for parallel GitHub API requests, and retry budget for rate-limited ones
+MAX_CONCURRENT_REQUESTS = 10
+MAX_RETRIES = 5
+
+_GITHUB_URL_RE = re.compile(r"github\.com[:/]([^/]+)/([^/.]+)")
+# A run of unsafe filename characters, dashes and whitespace
+_FILENAME_JUNK_RE = re.compile(r"(?:[^\w\s\-_.]|[-\s])+")
+_DIFF_FILE_START_RE = re.compile(r"^(?=diff --git )", re.MULTILINE)
+_DIFF_HEADER_RE = re.compile(r"diff --git a/(.+?) b/(.+)$")
+
+# Write buffer for markdown output files, and read size when streaming git diff output
+OUTPUT_BUFFER_SIZE = 1 << 20
+DIFF_CHUNK_SIZE = 1 << 20
+
+# Bytes requested per splice/sendfile call when copying git diff output in the kernel
+KERNEL_COPY_SIZE = 1 << 30
+
+# Upper bound for deepening a shallow fetch before falling back to --unshallow
+MAX_FETCH_DEPTH = 1600
+
+
+def _replace_filename_junk(match: re.Match[str]) -> str:
+    """Collapse a run of unsafe characters and separators for sanitize_filename."""
+
+    return "-" if any(char == "-" or char.isspace() for char in match.group()) else ""
+
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize a string to be safe for use as a filename."""
 
-    # Replace spaces with hyphens and remove/replace unsafe characters
-    sanitized = re.sub(r"[^\w\s\-_.]", "", filename)
-    sanitized = re.sub(r"[-\s]+", "-", sanitized)
+    # Replace spaces with hyphens and remove/replace unsafe characters in one pass:
+    # a run collapses to a single hyphen if it contains any separator, else vanishes
+    sanitized = _FILENAME_JUNK_RE.sub(_replace_filename_junk, filename)
     return sanitized.strip("-")
 
 
-def get_pr_info(repo_url: str, pr_number: int, token: str | None = None) -> dict[str, str]:
-    """Get PR information from GitHub API."""
+def normalize_remote_url(remote_url: str) -> str:
+    """Convert a git remote URL into an HTTPS GitHub URL."""
 
-    # Extract owner and repo name from URL
-    match = re.search(r"github\.com[:/]([^/]+)/([^/.]+)", repo_url)
+    # Convert SSH URL to HTTPS if needed
+    if remote_url.startswith("git@github.com:"):
+        remote_url = remote_url.replace("git@github.com:", "https://github.com/")
+    if remote_url.endswith(".git"):
+        remote_url = remote_url[:-4]
+    return remote_url
+
+
+def parse_github_url(repo_url: str) -> tuple[str, str]:
+    """Extract the owner and repository name from a GitHub URL."""
+
+    match = _GITHUB_URL_RE.search(repo_url)
     if not match:
         raise ValueError(f"Could not parse GitHub URL: {repo_url}")
 
     owner, repo_name = match.groups()
+    return owner, repo_name
+
+
+def github_headers(token: str | None = None, accept: str = JSON_MEDIA_TYPE) -> dict[str, str]:
+    """Build request headers for the GitHub REST API."""
+
+    headers = {"Accept": accept}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+def _send_with_rate_limit(send: Callable[[], httpx.Response]) -> httpx.Response:
+    """Send a sync request, pacing and retrying it according to GitHub's rate limits."""
+
+    def attempt() -> httpx.Response:
+        rate_limiter.wait()
+        response = send()
+        rate_limiter.update(response)
+        return response
+
+    # After the last retry the response is returned even if it is still rate limited
+    response = attempt()
+    for _ in range(MAX_RETRIES):
+        if not rate_limiter.should_retry(response):
+            break
+        response = attempt()
+    return response
+
+
+def _async_client(token: str | None = None, accept: str = JSON_MEDIA_TYPE) -> httpx.AsyncClient:
+    """Create an async GitHub API client that reports responses to the rate limiter."""
+
+    return httpx.AsyncClient(
+        headers=github_headers(token, accept=accept),
+        timeout=30,
+        follow_redirects=True,
+        event_hooks={"response": [rate_limiter.on_response]},
+    )
+
+
+async def _get_with_retry(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    url: str,
+    params: dict[str, Any] | None = None,
+) -> httpx.Response:
+    """GET a URL under the concurrency cap, pacing and retrying it per GitHub's rate limits."""
+
+    async def attempt() -> httpx.Response:
+        async with semaphore:
+            await rate_limiter.acquire()
+            return await client.get(url, params=params)
+
+    # The client's event hook records how long to back off before each retry
+    response = await attempt()
+    for _ in range(MAX_RETRIES):
+        if not rate_limiter.should_retry(response):
+            break
+        response = await attempt()
+
+    response.raise_for_status()
+    return response
+
+
+async def _fetch_prs(owner: str, repo_name: str, token: str | None = None) -> list[dict[str, Any]]:
+    """Fetch all open PRs, requesting every page after the first concurrently."""
+
+    url = f"{GITHUB_API_URL}/repos/{owner}/{repo_name}/pulls"
+    params: dict[str, Any] = {"state": "open", "per_page": 100}
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async with _async_client(token) as client:
+        first = await _get_with_retry(client, semaphore, url, params)
+
+        # The first page's Link header tells us how many pages there are in total
+        last_url = first.links.get("last", {}).get("url")
+        last_page = int(httpx.URL(last_url).params.get("page", 1)) if last_url else 1
+
+        rest = await asyncio.gather(
+            *[
+                _get_with_retry(client, semaphore, url, {**params, "page": page})
+                for page in range(2, last_page + 1)
+            ]
+        )
+
+    pulls: list[dict[str, Any]] = []
+    for response in [first, *rest]:
+        pulls.extend(response.json())
+    return pulls
+
+
+def graphql_request(query: str, variables: dict[str, Any], token: str) -> dict[str, Any]:
+    """Run a GitHub GraphQL query and return its data payload."""
+
+    response = _send_with_rate_limit(
+        lambda: httpx.post(
+            GITHUB_GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+            headers=github_headers(token),
+            timeout=30,
+        )
+    )
+    response.raise_for_status()
+    payload = response.json()
+
+    if payload.get("errors"):
+        messages = "; ".join(error.get("message", str(error)) for error in payload["errors"])
+        raise RuntimeError(f"GitHub GraphQL query failed: {messages}")
+
+    return payload["data"]
+
+
+def _graphql_list_prs(owner: str, repo_name: str, token: str) -> list[dict[str, str]]:
+    """List open PRs with GraphQL, fetching only the fields we display."""
+
+    pr_list = []
+    cursor = None
+
+    while True:
+        data = graphql_request(
+            OPEN_PRS_QUERY, {"owner": owner, "name": repo_name, "cursor": cursor}, token
+        )
+        repository = data["repository"]
+        if repository is None:
+            raise ValueError(f"Repository '{owner}/{repo_name}' not found")
+
+        pull_requests = repository["pullRequests"]
+        for node in pull_requests["nodes"]:
+            pr_list.append(
+                {
+                    "number": str(node["number"]),
+                    "title": node["title"],
+                    "branch": node["headRefName"],
+                    # Deleted accounts come back with a null author
+                    "author": node["author"]["login"] if node["author"] else "ghost",
+                    "created": node["createdAt"][:10],
+                    "url": node["url"],
+                }
+            )
+
+        page_info = pull_requests["pageInfo"]
+        if not page_info["hasNextPage"]:
+            return pr_list
+        cursor = page_info["endCursor"]
+
+
+def get_json_conditional(url: str, token: str | None = None) -> Any:
+    """GET a REST resource, revalidating any previously fetched copy with its ETag."""
+
+    cache_key = f"etag:{url}"
+    cached = cache.get(cache_key)
+
+    headers = github_headers(token)
+    if cached:
+        headers["If-None-Match"] = cached["etag"]
+
+    response = _send_with_rate_limit(
+        lambda: httpx.get(url, headers=headers, timeout=30, follow_redirects=True)
+    )
+
+    # 304s don't count against the rate limit and carry no body
+    if response.status_code == 304 and cached:
+        return cached["body"]
+
+    response.raise_for_status()
+    body = response.json()
+
+    etag = response.headers.get("ETag")
+    if etag:
+        cache.set(cache_key, {"etag": etag, "body": body})
+    return body
 
-    # Initialize GitHub client
-    g = Github(token) if token else Github()
+
+def _format_timestamp(value: str | None) -> str:
+    """Normalize a GitHub ISO-8601 timestamp (e.g. 2024-05-01T12:00:00Z) to isoformat."""
+
+    return datetime.fromisoformat(value).isoformat() if value else ""
+
+
+@ttl_cached(key=lambda repo_url, pr_number, token=None: (repo_url, pr_number), ttl=PR_INFO_TTL)
+def get_pr_info(repo_url: str, pr_number: int, token: str | None = None) -> dict[str, str]:
+    """Get PR information from GitHub API."""
+
+    # Extract owner and repo name from URL
+    owner, repo_name = parse_github_url(repo_url)
 
     try:
-        repo = g.get_repo(f"{owner}/{repo_name}")
-        pr = repo.get_pull(pr_number)
+        pr = get_json_conditional(
+            f"{GITHUB_API_URL}/repos/{owner}/{repo_name}/pulls/{pr_number}", token
+        )
 
         return {
-            "title": pr.title,
-            "description": pr.body or "",
-            "author": pr.user.login,
-            "created_at": pr.created_at.isoformat() if pr.created_at else "",
-            "updated_at": pr.updated_at.isoformat() if pr.updated_at else "",
-            "state": pr.state,
-            "base_branch": pr.base.ref,
-            "head_branch": pr.head.ref,
-            "url": pr.html_url,
-            "number": str(pr.number),
+            "title": pr["title"],
+            "description": pr["body"] or "",
+            "author": pr["user"]["login"],
+            "created_at": _format_timestamp(pr["created_at"]),
+            "updated_at": _format_timestamp(pr["updated_at"]),
+            "state": pr["state"],
+            "base_branch": pr["base"]["ref"],
+            "head_branch": pr["head"]["ref"],
+            "url": pr["html_url"],
+            "number": str(pr["number"]),
         }
     except Exception as e:
         error_msg = str(e)
@@ -64,150 +333,537 @@ def get_pr_info(repo_url: str, pr_number: int, token: str | None = None) -> dict
             raise RuntimeError(f"Failed to fetch PR info: {e}")
 
 
+def _graphql_pr_infos(
+    owner: str, repo_name: str, pr_numbers: list[int], token: str
+) -> list[dict[str, str]]:
+    """Fetch PR information for several PRs with a single aliased GraphQL query."""
+
+    aliases = "\n".join(
+        f"pr{number}: pullRequest(number: {number}) {{ {PR_INFO_FIELDS} }}" for number in pr_numbers
+    )
+    query = (
+        "query($owner: String!, $name: String!) {\n"
+        f"  repository(owner: $owner, name: $name) {{\n{aliases}\n  }}\n"
+        "}"
+    )
+    data = graphql_request(query, {"owner": owner, "name": repo_name}, token)
+    if data["repository"] is None:
+        raise ValueError(f"Repository '{owner}/{repo_name}' not found")
+
+    pr_infos = []
+    for number in pr_numbers:
+        node = data["repository"][f"pr{number}"]
+        state = node["state"].lower()
+        pr_infos.append(
+            {
+                "title": node["title"],
+                "description": node["body"] or "",
+                # Deleted accounts come back with a null author
+                "author": node["author"]["login"] if node["author"] else "ghost",
+                "created_at": _format_timestamp(node["createdAt"]),
+                "updated_at": _format_timestamp(node["updatedAt"]),
+                # REST reports merged PRs as closed; keep the two paths consistent
+                "state": "closed" if state == "merged" else state,
+                "base_branch": node["baseRefName"],
+                "head_branch": node["headRefName"],
+                "url": node["url"],
+                "number": str(node["number"]),
+            }
+        )
+    return pr_infos
+
+
+def _origin_url(git_cmd: git.cmd.Git) -> str:
+    """Return the local clone's origin URL as an HTTPS GitHub URL."""
+
+    return normalize_remote_url(git_cmd.config("--get", "remote.origin.url"))
+
+
+def _has_merge_base(git_cmd: git.cmd.Git, base_ref: str, head_ref: str) -> bool:
+    """Check whether two refs share a merge base in the local object store."""
+
+    import git
+
+    try:
+        git_cmd.merge_base(base_ref, head_ref)
+        return True
+    except git.GitCommandError:
+        return False
+
+
+def _is_shallow(git_cmd: git.cmd.Git) -> bool:
+    """Check whether the repository's history is truncated by an earlier shallow fetch."""
+
+    return git_cmd.rev_parse("--is-shallow-repository") == "true"
+
+
+def _has_ref(git_cmd: git.cmd.Git, ref: str) -> bool:
+    """Check whether a ref exists in the local repository."""
+
+    import git
+
+    try:
+        git_cmd.rev_parse("--verify", "--quiet", ref)
+        return True
+    except git.GitCommandError:
+        return False
+
+
+def fetch_pr_branches(
+    git_cmd: git.cmd.Git,
+    base_branch: str,
+    head_branch: str,
+    depth: int | None = DEFAULT_FETCH_DEPTH,
+) -> None:
+    """Fetch only the base and head branches, deepening shallow history as needed.
+
+    ``depth`` only applies to repositories that are already shallow (0 fetches their full
+    history); full clones are fetched normally so they never become shallow.
+    """
+
+    refspecs = [
+        f"+refs/heads/{base_branch}:refs/remotes/origin/{base_branch}",
+        f"+refs/heads/{head_branch}:refs/remotes/origin/{head_branch}",
+    ]
+    if not _is_shallow(git_cmd):
+        git_cmd.fetch("origin", *refspecs)
+        return
+
+    if not depth:
+        git_cmd.fetch("origin", *refspecs, unshallow=True)
+        return
+
+    # `--depth` would cut history back to depth commits, discarding whatever earlier runs
+    # deepened; once both refs exist, a plain fetch keeps the current shallow boundary
+    branch_refs = [f"refs/remotes/origin/{base_branch}", f"refs/remotes/origin/{head_branch}"]
+    if all(_has_ref(git_cmd, ref) for ref in branch_refs):
+        git_cmd.fetch("origin", *refspecs)
+    else:
+        git_cmd.fetch("origin", *refspecs, depth=depth)
+
+    # The shallow history may stop short of the merge base needed for the A...B diff,
+    # so deepen it by doubling steps until it resolves
+    deepen = depth
+    while deepen <= MAX_FETCH_DEPTH:
+        if _has_merge_base(git_cmd, f"origin/{base_branch}", f"origin/{head_branch}"):
+            return
+        git_cmd.fetch("origin", *refspecs, deepen=deepen)
+        deepen *= 2
+
+    if _has_merge_base(git_cmd, f"origin/{base_branch}", f"origin/{head_branch}"):
+        return
+    if _is_shallow(git_cmd):
+        git_cmd.fetch("origin", *refspecs, unshallow=True)
+    else:
+        git_cmd.fetch("origin", *refspecs)
+
+
+def fetch_all_branches(git_cmd: git.cmd.Git, depth: int | None = DEFAULT_FETCH_DEPTH) -> None:
+    """Fetch every branch in origin's configured refspec without changing the history depth.
+
+    Shallow clones keep their current shallow boundary; as with :func:`fetch_pr_branches`,
+    a ``depth`` of 0 fetches their full history.
+    """
+
+    if not depth and _is_shallow(git_cmd):
+        git_cmd.fetch("origin", unshallow=True)
+    else:
+        git_cmd.fetch("origin")
+
+
+def _map_refspec(source: str, destination: str, ref: str) -> str | None:
+    """Return where a refspec's source pattern maps ref to, or None if it doesn't match."""
+
+    if "*" not in source:
+        return destination if source == ref else None
+
+    prefix, suffix = source.split("*", 1)
+    if len(ref) < len(prefix) + len(suffix) or not (
+        ref.startswith(prefix) and ref.endswith(suffix)
+    ):
+        return None
+    return destination.replace("*", ref[len(prefix) : len(ref) - len(suffix)], 1)
+
+
+def _fetched_by_refspec(git_cmd: git.cmd.Git, branch: str) -> bool:
+    """Check whether a plain `git fetch origin` updates origin/<branch>."""
+
+    import git
+
+    try:
+        refspecs = git_cmd.config("--get-all", "remote.origin.fetch").splitlines()
+    except git.GitCommandError:
+        return False
+
+    ref = f"refs/heads/{branch}"
+    covered = False
+    for refspec in refspecs:
+        refspec = refspec.strip().removeprefix("+")
+        if refspec.startswith("^"):
+            # Negative refspecs exclude matching refs whatever the other refspecs say
+            if _map_refspec(refspec[1:], refspec[1:], ref) is not None:
+                return False
+            continue
+        source, _, destination = refspec.partition(":")
+        if _map_refspec(source, destination, ref) == f"refs/remotes/origin/{branch}":
+            covered = True
+    return covered
+
+
+def _diff_args(
+    git_cmd: git.cmd.Git, base_branch: str, head_branch: str, target_dir: str | None = None
+) -> list[str]:
+    """Build the `git diff` arguments for a PR, optionally limited to a directory."""
+
+    args = [f"origin/{base_branch}...origin/{head_branch}"]
+    if target_dir:
+        # Make target_dir relative to repo root if it's absolute
+        if os.path.isabs(target_dir):
+            repo_root = git_cmd.rev_parse("--show-toplevel")
+            if repo_root and target_dir.startswith(repo_root):
+                target_dir = os.path.relpath(target_dir, repo_root)
+
+        args.extend(["--", target_dir])
+    return args
+
+
 def get_git_diff(
-    repo_path: str, base_branch: str, head_branch: str, target_dir: str | None = None
+    repo_path: str,
+    base_branch: str,
+    head_branch: str,
+    target_dir: str | None = None,
+    depth: int | None = DEFAULT_FETCH_DEPTH,
+    fetch: bool = True,
 ) -> str:
-    """Get git diff for specified directory or entire repo."""
+    """Get git diff for specified directory or entire repo.
+
+    Pass ``fetch=False`` when the branches have already been fetched.
+    """
+
+    import git
 
     try:
-        repo = git.Repo(repo_path)
+        # A bare command runner is all we need; building a Repo object costs extra I/O
+        git_cmd = git.cmd.Git(repo_path)
 
-        # Ensure we have the latest refs
-        repo.remotes.origin.fetch()
+        # Ensure we have the latest refs for the two branches being compared
+        if fetch:
+            fetch_pr_branches(git_cmd, base_branch, head_branch, depth)
 
-        # Create diff command
-        if target_dir:
-            # Make target_dir relative to repo root if it's absolute
-            if os.path.isabs(target_dir):
-                repo_root = repo.working_tree_dir
-                if repo_root and target_dir.startswith(str(repo_root)):
-                    target_dir = os.path.relpath(target_dir, repo_root)
+        return git_cmd.diff(*_diff_args(git_cmd, base_branch, head_branch, target_dir))
+    except Exception as e:
+        raise RuntimeError(f"Failed to get git diff: {e}")
 
-            diff = repo.git.diff(f"origin/{base_branch}...origin/{head_branch}", "--", target_dir)
-        else:
-            diff = repo.git.diff(f"origin/{base_branch}...origin/{head_branch}")
 
-        return diff
+def _kernel_copy(in_fd: int, out_fd: int) -> int:
+    """Move up to KERNEL_COPY_SIZE bytes from a pipe to a file without a user-space copy."""
+
+    # splice is the Linux call for pipe input; sendfile covers platforms that allow it instead
+    if hasattr(os, "splice"):
+        return os.splice(in_fd, out_fd, KERNEL_COPY_SIZE)
+    return os.sendfile(out_fd, in_fd, None, KERNEL_COPY_SIZE)
+
+
+def _kernel_copy_diff(stdout: BinaryIO, out: BinaryIO) -> bool:
+    """Copy git's stdout into a regular, readable file in the kernel, dropping the final newline.
+
+    Returns False without writing anything when the output or platform does not support it.
+    """
+
+    if not (hasattr(os, "splice") or hasattr(os, "sendfile")) or not out.readable():
+        return False
+    try:
+        out_fd = out.fileno()
+    except (OSError, ValueError):
+        # In-memory streams have no file descriptor
+        return False
+    if not stat.S_ISREG(os.fstat(out_fd).st_mode):
+        return False
+
+    out.flush()
+    start = os.lseek(out_fd, 0, os.SEEK_CUR)
+    in_fd = stdout.fileno()
+    try:
+        while _kernel_copy(in_fd, out_fd):
+            pass
+    except OSError:
+        # Unsupported fd pairs fail on the first call; fall back to copying through user space
+        if os.lseek(out_fd, 0, os.SEEK_CUR) != start:
+            raise
+        return False
+
+    # The kernel moved the fd offset behind the file object's back; resync, then drop the
+    # trailing newline so the file matches get_git_diff
+    end = os.lseek(out_fd, 0, os.SEEK_CUR)
+    if end > start and os.pread(out_fd, 1, end - 1) == b"\n":
+        out.seek(end - 1)
+        out.truncate()
+    else:
+        out.seek(end)
+    return True
+
+
+def write_git_diff(
+    repo_path: str,
+    base_branch: str,
+    head_branch: str,
+    out: BinaryIO,
+    target_dir: str | None = None,
+    depth: int | None = DEFAULT_FETCH_DEPTH,
+    fetch: bool = True,
+) -> None:
+    """Stream git diff output to a binary file object without holding it in memory.
+
+    Writes exactly what :func:`get_git_diff` would return, i.e. without git's final newline.
+    Readable regular files receive the output straight from git's pipe via splice/sendfile.
+    """
+
+    import git
+
+    try:
+        git_cmd = git.cmd.Git(repo_path)
+
+        # Ensure we have the latest refs for the two branches being compared
+        if fetch:
+            fetch_pr_branches(git_cmd, base_branch, head_branch, depth)
+
+        proc = git_cmd.execute(
+            ["git", "diff", *_diff_args(git_cmd, base_branch, head_branch, target_dir)],
+            as_process=True,
+        )
+        stdout = proc.stdout
+        assert stdout is not None
+
+        if not _kernel_copy_diff(stdout, out):
+            # Hold back a trailing newline until we know it isn't the last byte of the output
+            pending = b""
+            while chunk := stdout.read(DIFF_CHUNK_SIZE):
+                out.write(pending)
+                if chunk.endswith(b"\n"):
+                    out.write(memoryview(chunk)[:-1])
+                    pending = b"\n"
+                else:
+                    out.write(chunk)
+                    pending = b""
+
+        # Raises GitCommandError if git exited non-zero
+        proc.wait()
     except Exception as e:
         raise RuntimeError(f"Failed to get git diff: {e}")
 
 
+def get_remote_diff(owner: str, repo_name: str, pr_number: int, token: str | None = None) -> str:
+    """Get the unified diff for a PR directly from the GitHub API."""
+
+    try:
+        response = _send_with_rate_limit(
+            lambda: httpx.get(
+                f"{GITHUB_API_URL}/repos/{owner}/{repo_name}/pulls/{pr_number}",
+                headers=github_headers(token, accept=DIFF_MEDIA_TYPE),
+                timeout=30,
+                follow_redirects=True,
+            )
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404 and not token:
+            raise RuntimeError(
+                f"Repository '{owner}/{repo_name}' or PR #{pr_number} not found, or repository is private. "
+                "Please provide a GitHub token using --token or set GITHUB_TOKEN environment variable."
+            )
+        raise RuntimeError(f"Failed to fetch PR diff: {e}")
+    except httpx.HTTPError as e:
+        raise RuntimeError(f"Failed to fetch PR diff: {e}")
+
+    # Drop the final newline as GitPython does for local diffs, so both modes match
+    return response.text.removesuffix("\n")
+
+
+def filter_diff_by_dir(diff_content: str, target_dir: str) -> str:
+    """Keep only the file sections of a unified diff that touch the target directory.
+
+    Like a git pathspec, ``target_dir`` may also name a single file, and ``.`` keeps everything.
+    """
+
+    target = os.path.normpath(target_dir).strip("/")
+    if target in ("", "."):
+        return diff_content
+
+    prefix = target + "/"
+    sections = _DIFF_FILE_START_RE.split(diff_content)
+    kept = []
+
+    for section in sections:
+        header = section.split("\n", 1)[0]
+        match = _DIFF_HEADER_RE.match(header)
+        if match and any(path == target or path.startswith(prefix) for path in match.groups()):
+            kept.append(section)
+
+    return "".join(kept).removesuffix("\n")
+
+
+MARKDOWN_FOOTER = "\n```"
+
+
+def markdown_header(pr_info: dict[str, str], target_dir: str | None = None) -> str:
+    """Build the markdown that precedes the diff: metadata, description and code fence."""
+
+    # Optional sections carry their own leading blank line, so the template stays one expression
+    target_block = f"\n**Target Directory:** `{target_dir}`\n" if target_dir else ""
+    desc_block = (
+        f"\n## Description\n\n{pr_info['description']}\n" if pr_info["description"].strip() else ""
+    )
+
+    return (
+        f"# {pr_info['title']}\n"
+        "\n"
+        f"**PR #{pr_info['number']}** - {pr_info['state'].title()}\n"
+        f"**Author:** {pr_info['author']}\n"
+        f"**Created:** {pr_info['created_at']}\n"
+        f"**Updated:** {pr_info['updated_at']}\n"
+        f"**Base Branch:** {pr_info['base_branch']}\n"
+        f"**Head Branch:** {pr_info['head_branch']}\n"
+        f"**URL:** {pr_info['url']}\n"
+        f"{target_block}{desc_block}"
+        "\n## Changes\n\n```diff\n"
+    )
+
+
+def _is_regular_output(path: Path) -> bool:
+    """Check whether an output path is, or will be created as, a regular file."""
+
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return True
+
+
+def write_markdown_file(
+    path: Path, pr_info: dict[str, str], diff_content: str, target_dir: str | None = None
+) -> None:
+    """Write a PR markdown file by copying its encoded sections into a memory-mapped file."""
+
+    header = markdown_header(pr_info, target_dir).encode()
+    diff = diff_content.encode()
+    footer = MARKDOWN_FOOTER.encode()
+
+    # Pipes, FIFOs and devices (e.g. -o /dev/stdout) can't be sized or mapped
+    if not _is_regular_output(path):
+        with open(path, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+            f.write(header)
+            f.write(diff)
+            f.write(footer)
+        return
+
+    diff_end = len(header) + len(diff)
+    total = diff_end + len(footer)
+
+    # Size the file up front so the sections can be copied straight into the page cache
+    with open(path, "w+b") as f:
+        f.truncate(total)
+        with mmap.mmap(f.fileno(), total) as mm:
+            mm[: len(header)] = header
+            mm[len(header) : diff_end] = diff
+            mm[diff_end:total] = footer
+
+
 def generate_markdown(
     pr_info: dict[str, str], diff_content: str, target_dir: str | None = None
 ) -> str:
     """Generate markdown content from PR info and diff."""
 
-    markdown_lines = [
-        f"# {pr_info['title']}",
-        "",
-        f"**PR #{pr_info['number']}** - {pr_info['state'].title()}",
-        f"**Author:** {pr_info['author']}",
-        f"**Created:** {pr_info['created_at']}",
-        f"**Updated:** {pr_info['updated_at']}",
-        f"**Base Branch:** {pr_info['base_branch']}",
-        f"**Head Branch:** {pr_info['head_branch']}",
-        f"**URL:** {pr_info['url']}",
-        "",
-    ]
+    # One concatenation with the (possibly huge) diff last, instead of assembling a buffer
+    return markdown_header(pr_info, target_dir) + diff_content + MARKDOWN_FOOTER
 
-    if target_dir:
-        markdown_lines.extend(
-            [
-                f"**Target Directory:** `{target_dir}`",
-                "",
-            ]
-        )
 
-    if pr_info["description"].strip():
-        markdown_lines.extend(
-            [
-                "## Description",
-                "",
-                pr_info["description"],
-                "",
-            ]
-        )
+def resolve_output_path(output_path: str, pr_info: dict[str, str]) -> Path:
+    """Resolve the markdown file path for a PR from a file or directory output path."""
 
-    markdown_lines.extend(
-        [
-            "## Changes",
-            "",
-            "```diff",
-            diff_content,
-            "```",
-        ]
+    # If output_path is provided, use it as-is (could be a file or directory)
+    output_path_obj = Path(output_path)
+    if output_path_obj.is_dir() or output_path.endswith("/"):
+        # It's a directory, generate filename
+        safe_title = sanitize_filename(pr_info["title"])
+        filename = f"pr-{pr_info['number']}-{safe_title}.md"
+        return output_path_obj / filename
+
+    # It's a full file path
+    return output_path_obj
+
+
+@ttl_cached(
+    key=lambda owner, repo_name, branch, token=None: (owner, repo_name, branch), ttl=OPEN_PRS_TTL
+)
+def find_pr_for_branch(
+    owner: str, repo_name: str, branch: str, token: str | None = None
+) -> int | None:
+    """Find the open PR whose head is the given branch, or None if there is none."""
+
+    pulls_url = f"{GITHUB_API_URL}/repos/{owner}/{repo_name}/pulls"
+
+    # Search for PRs with the remote branch as head; one result is all we need
+    first_page = get_json_conditional(
+        str(
+            httpx.URL(
+                pulls_url, params={"state": "open", "head": f"{owner}:{branch}", "per_page": 1}
+            )
+        ),
+        token,
     )
+    if first_page:
+        # Return the first (most recent) PR
+        return first_page[0]["number"]
+
+    # Let the server match the head branch rather than scanning every open PR
+    if token:
+        data = graphql_request(
+            BRANCH_PR_QUERY, {"owner": owner, "name": repo_name, "branch": branch}, token
+        )
+        nodes = data["repository"]["pullRequests"]["nodes"] if data["repository"] else []
+        return nodes[0]["number"] if nodes else None
 
-    return "\n".join(markdown_lines)
+    # GraphQL needs auth, so fall back to iterating through all open PRs (e.g. from forks)
+    for pr in asyncio.run(_fetch_prs(owner, repo_name, token)):
+        if pr["head"]["ref"] == branch:
+            return pr["number"]
+
+    return None
 
 
 def get_current_pr_number(repo_path: str, token: str | None = None) -> int:
     """Get the PR number for the current branch."""
 
+    import git
+
     owner = None
     repo_name = None
     current_branch = None
     try:
-        repo = git.Repo(repo_path)
-        current_branch = repo.active_branch.name
-        remote_url = repo.remotes.origin.url
-
-        # Convert SSH URL to HTTPS if needed
-        if remote_url.startswith("git@github.com:"):
-            remote_url = remote_url.replace("git@github.com:", "https://github.com/")
-        if remote_url.endswith(".git"):
-            remote_url = remote_url[:-4]
+        git_cmd = git.cmd.Git(repo_path)
+        current_branch = git_cmd.symbolic_ref("--short", "HEAD")
+        remote_url = _origin_url(git_cmd)
 
         # Extract owner and repo name from URL
-        match = re.search(r"github\.com[:/]([^/]+)/([^/.]+)", remote_url)
-        if not match:
-            raise ValueError(f"Could not parse GitHub URL: {remote_url}")
-
-        owner, repo_name = match.groups()
-
-        # Initialize GitHub client
-        g = Github(token) if token else Github()
-
-        repo_obj = g.get_repo(f"{owner}/{repo_name}")
+        owner, repo_name = parse_github_url(remote_url)
 
         # Get the remote tracking branch for the current branch
         try:
-            current_branch_obj = repo.heads[current_branch]
-            tracking_branch = current_branch_obj.tracking_branch()
-            if tracking_branch:
-                # Extract the remote branch name (e.g., "origin/feature-branch" -> "feature-branch")
-                remote_branch_name = tracking_branch.remote_head
-            else:
-                remote_branch_name = current_branch
+            # The upstream's merge ref names the remote branch (e.g. "refs/heads/feature-branch")
+            merge_ref = git_cmd.config("--get", f"branch.{current_branch}.merge")
+            remote_branch_name = merge_ref.removeprefix("refs/heads/")
         except Exception:
             # Fallback to current branch name if tracking branch detection fails
             remote_branch_name = current_branch
 
-        # Search for PRs with the remote branch as head
-        pulls = repo_obj.get_pulls(state="open", head=f"{owner}:{remote_branch_name}")
-        pulls_list = list(pulls)
-
-        if not pulls_list:
-            # Try without owner prefix in case of forks
-            pulls = repo_obj.get_pulls(state="open", head=remote_branch_name)
-            pulls_list = list(pulls)
-
-        if not pulls_list:
-            # Iterate through all open PRs and find one with matching head branch
-            all_pulls = repo_obj.get_pulls(state="open")
-            for pr in all_pulls:
-                if pr.head.ref == remote_branch_name:
-                    return pr.number
-
-            # If we get here, no PR was found by iterating through all PRs
+        pr_number = find_pr_for_branch(owner, repo_name, remote_branch_name, token)
+        if pr_number is None:
             raise ValueError(
                 f"No open PR found for branch '{current_branch}' "
                 f"(remote: '{remote_branch_name}'). "
                 f"Make sure there's an open PR for this branch."
             )
 
-        # Return the first (most recent) PR
-        return pulls_list[0].number
+        return pr_number
 
     except Exception as e:
         error_msg = str(e)
@@ -234,56 +890,160 @@ def get_current_pr_number(repo_path: str, token: str | None = None) -> int:
             raise RuntimeError(f"Failed to get current branch PR: {e}")
 
 
+def is_git_repo(repo_path: str) -> bool:
+    """Check whether a path is a git working tree or a bare repository."""
+
+    path = Path(repo_path)
+    if (path / ".git").exists():
+        return True
+    return (path / "HEAD").is_file() and (path / "objects").is_dir()
+
+
+def _resolve_remote_url(repo_path: str, repo_url: str | None = None) -> str:
+    """Return the GitHub URL given explicitly, or else the local clone's origin URL."""
+
+    if repo_url:
+        return normalize_remote_url(repo_url)
+
+    if not is_git_repo(repo_path):
+        raise ValueError(
+            f"'{repo_path}' is not a git repository; provide the GitHub repository URL."
+        )
+
+    import git
+
+    return _origin_url(git.cmd.Git(repo_path))
+
+
+def _get_pr_info_while_fetching(
+    repo_path: str,
+    remote_url: str,
+    pr_number: int,
+    token: str | None = None,
+    depth: int | None = DEFAULT_FETCH_DEPTH,
+) -> dict[str, str]:
+    """Get PR information while fetching origin's branches, so the two round trips overlap.
+
+    The parallel fetch covers every branch in origin's configured refspec, which on a
+    repository with many busy branches can download more than the PR needs; narrow
+    ``remote.origin.fetch`` or use ``--remote-diff`` when that outweighs the overlap.
+    """
+
+    import git
+
+    git_cmd = git.cmd.Git(repo_path)
+
+    # Branch names aren't known until the PR info arrives, so fetch them all meanwhile
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pr_info_future = executor.submit(get_pr_info, remote_url, pr_number, token)
+        fetch_future = executor.submit(fetch_all_branches, git_cmd, depth)
+        pr_info = pr_info_future.result()
+        fetch_future.result()
+
+    # Branches outside the refspec (e.g. in single-branch clones) weren't updated above, and
+    # a ref left by an earlier run would be stale; shallow history may also lack the merge
+    # base. Fetch the PR's branches specifically in either case
+    base_branch, head_branch = pr_info["base_branch"], pr_info["head_branch"]
+    if not (
+        _fetched_by_refspec(git_cmd, base_branch)
+        and _fetched_by_refspec(git_cmd, head_branch)
+        and _has_merge_base(git_cmd, f"origin/{base_branch}", f"origin/{head_branch}")
+    ):
+        fetch_pr_branches(git_cmd, base_branch, head_branch, depth)
+
+    return pr_info
+
+
 def collect_pr_data(
     repo_path: str,
     pr_number: int | None,
     output_path: str | None = None,
     target_dir: str | None = None,
     token: str | None = None,
-) -> tuple[str | None, str]:
-    """Main function to collect PR data and generate markdown file."""
+    fetch_depth: int | None = DEFAULT_FETCH_DEPTH,
+    remote_diff: bool = False,
+    repo_url: str | None = None,
+    return_content: bool = True,
+) -> tuple[str | None, str | None]:
+    """Main function to collect PR data and generate markdown file.
+
+    The markdown string is only returned when ``return_content`` is set; otherwise it is
+    streamed straight to the output file.
+    """
 
     try:
+        # Without a local clone the diff can only come from the GitHub API
+        has_local_repo = is_git_repo(repo_path)
+        use_remote_diff = remote_diff or not has_local_repo
+
         # Auto-detect PR number if not provided
         if pr_number is None:
+            if not has_local_repo:
+                raise ValueError(f"'{repo_path}' is not a git repository; a PR number is required.")
             pr_number = get_current_pr_number(repo_path, token)
 
-        repo = git.Repo(repo_path)
-        remote_url = repo.remotes.origin.url
+        remote_url = _resolve_remote_url(repo_path, repo_url)
+
+        # Get PR information and, at the same time, the diff or the commits it needs
+        diff_content = None
+        if use_remote_diff:
+            owner, repo_name = parse_github_url(remote_url)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                pr_info_future = executor.submit(get_pr_info, remote_url, pr_number, token)
+                diff_future = executor.submit(get_remote_diff, owner, repo_name, pr_number, token)
+                pr_info = pr_info_future.result()
+                diff_content = diff_future.result()
+
+            if target_dir:
+                if os.path.isabs(target_dir):
+                    target_dir = os.path.relpath(target_dir, repo_path)
+                diff_content = filter_diff_by_dir(diff_content, target_dir)
+        else:
+            pr_info = _get_pr_info_while_fetching(
+                repo_path, remote_url, pr_number, token, fetch_depth
+            )
 
-        # Convert SSH URL to HTTPS if needed
-        if remote_url.startswith("git@github.com:"):
-            remote_url = remote_url.replace("git@github.com:", "https://github.com/")
-        if remote_url.endswith(".git"):
-            remote_url = remote_url[:-4]
+        final_output_path = resolve_output_path(output_path, pr_info) if output_path else None
+        if final_output_path:
+            # Ensure parent directory exists
+            final_output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Get PR information
-        pr_info = get_pr_info(remote_url, pr_number, token)
+        if diff_content is None and final_output_path and not return_content:
+            # Nobody needs the string, so pipe git's output straight into the file. Regular files
+            # are opened readable so write_git_diff can copy in the kernel and check the last
+            # byte; pipes can't be opened that way and get the chunked copy instead
+            mode = "w+b" if _is_regular_output(final_output_path) else "wb"
+            with open(final_output_path, mode, buffering=OUTPUT_BUFFER_SIZE) as f:
+                f.write(markdown_header(pr_info, target_dir).encode())
+                write_git_diff(
+                    repo_path,
+                    pr_info["base_branch"],
+                    pr_info["head_branch"],
+                    f,
+                    target_dir,
+                    fetch=False,
+                )
+                f.write(MARKDOWN_FOOTER.encode())
+            return str(final_output_path), None
 
         # Get diff
-        diff_content = get_git_diff(
-            repo_path, pr_info["base_branch"], pr_info["head_branch"], target_dir
-        )
+        if diff_content is None:
+            diff_content = get_git_diff(
+                repo_path,
+                pr_info["base_branch"],
+                pr_info["head_branch"],
+                target_dir,
+                fetch=False,
+            )
 
-        # Generate markdown
-        markdown_content = generate_markdown(pr_info, diff_content, target_dir)
+        # Only build the markdown in memory when the caller needs the string
+        markdown_content = (
+            generate_markdown(pr_info, diff_content, target_dir) if return_content else None
+        )
 
         # Handle output path
-        if output_path:
-            # If output_path is provided, use it as-is (could be a file or directory)
-            output_path_obj = Path(output_path)
-            if output_path_obj.is_dir() or output_path.endswith("/"):
-                # It's a directory, generate filename
-                safe_title = sanitize_filename(pr_info["title"])
-                filename = f"pr-{pr_number}-{safe_title}.md"
-                final_output_path = output_path_obj / filename
-            else:
-                # It's a full file path
-                final_output_path = output_path_obj
-
-            # Ensure parent directory exists
-            final_output_path.parent.mkdir(parents=True, exist_ok=True)
-            final_output_path.write_text(markdown_content)
+        if final_output_path:
+            write_markdown_file(final_output_path, pr_info, diff_content, target_dir)
             return str(final_output_path), markdown_content
         else:
             # No file output, just return the content
@@ -294,47 +1054,126 @@ def collect_pr_data(
         raise RuntimeError(f"Failed to collect PR data: {e}") from e
 
 
-def list_open_prs(repo_path: str, token: str | None = None) -> list[dict[str, str]]:
-    """List all open PRs for the repository."""
+async def _collect_batch(
+    remote_url: str,
+    pr_numbers: list[int],
+    output_dir: Path | None,
+    target_dir: str | None,
+    token: str | None,
+    return_content: bool,
+) -> list[tuple[str | None, str | None]]:
+    """Fetch diffs concurrently and write one markdown file per PR."""
+
+    owner, repo_name = parse_github_url(remote_url)
+
+    if token:
+        pr_infos = _graphql_pr_infos(owner, repo_name, pr_numbers, token)
+    else:
+        # GraphQL needs auth, so look PRs up individually (still concurrently)
+        pr_infos = await asyncio.gather(
+            *[asyncio.to_thread(get_pr_info, remote_url, number, token) for number in pr_numbers]
+        )
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async with _async_client(token, accept=DIFF_MEDIA_TYPE) as client:
+
+        async def collect_one(pr_info: dict[str, str]) -> tuple[str | None, str | None]:
+            url = f"{GITHUB_API_URL}/repos/{owner}/{repo_name}/pulls/{pr_info['number']}"
+            # Same trailing-newline handling as get_remote_diff
+            diff_content = (await _get_with_retry(client, semaphore, url)).text.removesuffix("\n")
+            if target_dir:
+                diff_content = filter_diff_by_dir(diff_content, target_dir)
+
+            markdown_content = (
+                generate_markdown(pr_info, diff_content, target_dir)
+                if return_content or output_dir is None
+                else None
+            )
+            if output_dir is None:
+                return None, markdown_content
+
+            final_output_path = resolve_output_path(f"{output_dir}/", pr_info)
+            await asyncio.to_thread(
+                write_markdown_file, final_output_path, pr_info, diff_content, target_dir
+            )
+            return str(final_output_path), markdown_content
+
+        return await asyncio.gather(*[collect_one(pr_info) for pr_info in pr_infos])
+
+
+def collect_pr_data_batch(
+    repo_path: str,
+    pr_numbers: list[int],
+    output_path: str | None = None,
+    target_dir: str | None = None,
+    token: str | None = None,
+    repo_url: str | None = None,
+    return_content: bool = True,
+) -> list[tuple[str | None, str | None]]:
+    """Collect several PRs at once, returning an (output file, markdown) pair per PR.
+
+    PR metadata comes from one GraphQL query (when a token is available) and diffs are
+    fetched concurrently from the GitHub API, so no local fetch is needed. ``output_path``
+    is treated as a directory.
+    """
 
     try:
-        repo = git.Repo(repo_path)
-        remote_url = repo.remotes.origin.url
+        remote_url = _resolve_remote_url(repo_path, repo_url)
 
-        # Convert SSH URL to HTTPS if needed
-        if remote_url.startswith("git@github.com:"):
-            remote_url = remote_url.replace("git@github.com:", "https://github.com/")
-        if remote_url.endswith(".git"):
-            remote_url = remote_url[:-4]
+        if target_dir and os.path.isabs(target_dir):
+            target_dir = os.path.relpath(target_dir, repo_path)
 
-        # Extract owner and repo name from URL
-        match = re.search(r"github\.com[:/]([^/]+)/([^/.]+)", remote_url)
-        if not match:
-            raise ValueError(f"Could not parse GitHub URL: {remote_url}")
+        output_dir = None
+        if output_path:
+            output_dir = Path(output_path)
+            output_dir.mkdir(parents=True, exist_ok=True)
 
-        owner, repo_name = match.groups()
+        return asyncio.run(
+            _collect_batch(remote_url, pr_numbers, output_dir, target_dir, token, return_content)
+        )
 
-        # Initialize GitHub client
-        g = Github(token) if token else Github()
-        repo_obj = g.get_repo(f"{owner}/{repo_name}")
+    except Exception as e:
+        # Re-raise with proper error context
+        raise RuntimeError(f"Failed to collect PR data: {e}") from e
 
-        # Get all open PRs
-        all_pulls = repo_obj.get_pulls(state="open")
-        pr_list = []
 
-        for pr in all_pulls:
-            pr_list.append(
-                {
-                    "number": str(pr.number),
-                    "title": pr.title,
-                    "branch": pr.head.ref,
-                    "author": pr.user.login,
-                    "created": pr.created_at.strftime("%Y-%m-%d"),
-                    "url": pr.html_url,
-                }
-            )
+@ttl_cached(key=lambda owner, repo_name, token=None: (owner, repo_name), ttl=OPEN_PRS_TTL)
+def fetch_open_prs(owner: str, repo_name: str, token: str | None = None) -> list[dict[str, str]]:
+    """Fetch the open PRs of a GitHub repository."""
+
+    # GraphQL returns every listed field in one request per 100 PRs, but needs auth
+    if token:
+        return _graphql_list_prs(owner, repo_name, token)
+
+    # Get all open PRs
+    pulls = asyncio.run(_fetch_prs(owner, repo_name, token))
+
+    return [
+        {
+            "number": str(pr["number"]),
+            "title": pr["title"],
+            "branch": pr["head"]["ref"],
+            "author": pr["user"]["login"],
+            "created": pr["created_at"][:10],
+            "url": pr["html_url"],
+        }
+        for pr in pulls
+    ]
+
+
+def list_open_prs(repo_path: str, token: str | None = None) -> list[dict[str, str]]:
+    """List all open PRs for the repository."""
+
+    import git
+
+    try:
+        remote_url = _origin_url(git.cmd.Git(repo_path))
+
+        # Extract owner and repo name from URL
+        owner, repo_name = parse_github_url(remote_url)
 
-        return pr_list
+        return fetch_open_prs(owner, repo_name, token)
 
     except Exception as e:
         raise RuntimeError(f"Failed to list PRs: {e}")
@@ -0,0 +1,142 @@
+"""On-disk response cache for pr-collector."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+from .config import get_config_dir
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_MISSING = object()
+
+# Entries untouched for this long are pruned, which also bounds entries stored without a TTL
+MAX_ENTRY_AGE = 24 * 60 * 60
+
+
+class DiskCache:
+    """A small JSON-file cache with per-lookup expiry, stored under the config directory.
+
+    Expired entries are deleted when looked up, and every write prunes entries older than
+    ``max_age`` seconds so the directory stays bounded.
+    """
+
+    def __init__(self, directory: Path | None = None, max_age: float = MAX_ENTRY_AGE) -> None:
+        self._directory = directory
+        self.max_age = max_age
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding the cache entries (resolved lazily so config changes apply)."""
+        return self._directory or get_config_dir() / "http-cache"
+
+    def _entry_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: str, ttl: float | None = None, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or older than ttl seconds."""
+        path = self._entry_path(key)
+        try:
+            with path.open("r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            # Missing or corrupted entries are treated as cache misses
+            return default
+
+        if ttl is not None and time.time() - entry.get("stored_at", 0) > ttl:
+            path.unlink(missing_ok=True)
+            return default
+        return entry.get("value", default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key (best-effort; I/O errors are ignored)."""
+        directory = self.directory
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so concurrent readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"key": key, "stored_at": time.time(), "value": value}, f)
+            os.replace(tmp_path, self._entry_path(key))
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self.prune()
+
+    def prune(self) -> None:
+        """Remove entries written more than max_age seconds ago (best-effort)."""
+        cutoff = time.time() - self.max_age
+        try:
+            entries = list(self.directory.glob("*.json"))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    entry.unlink(missing_ok=True)
+            except OSError:
+                # Another process may have replaced or removed it meanwhile
+                continue
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        directory = self.directory
+        if not directory.exists():
+            return
+        for entry in directory.glob("*.json"):
+            entry.unlink(missing_ok=True)
+
+
+cache = DiskCache()
+
+
+def clear_cache() -> None:
+    """Remove every entry from the shared response cache."""
+    cache.clear()
+
+
+def ttl_cached(
+    key: Callable[..., tuple[Any, ...]], ttl: float
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Cache a function's JSON-serializable result on disk for ttl seconds.
+
+    ``key`` receives the same arguments as the decorated function and returns the
+    tuple identifying the result; it is namespaced by the function's qualified name.
+    Exceptions and ``None`` results are never cached.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        prefix = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            cache_key = f"{prefix}:{json.dumps(list(key(*args, **kwargs)))}"
+            cached = cache.get(cache_key, ttl=ttl, default=_MISSING)
+            if cached is not _MISSING:
+                return cached
+
+            result = func(*args, **kwargs)
+            if result is not None:
+                cache.set(cache_key, result)
+            return result
+
+        return wrapper
+
+    return decorator
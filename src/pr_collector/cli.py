@@ -6,13 +6,14 @@ import typer
 from rich.console import Console
 from rich.panel import Panel
 
-from .app import collect_pr_data, get_application_info, list_open_prs
 from .config import (
     ensure_config_exists,
     get_config_file,
+    get_fetch_depth,
     get_github_token,
     load_config,
     set_default_output_dir,
+    set_fetch_depth,
     set_github_token,
 )
 
@@ -47,12 +48,45 @@ def collect(
     token: str = typer.Option(
         None, "--token", "-t", help="GitHub token (or set GITHUB_TOKEN env var)"
     ),
+    depth: int = typer.Option(
+        None,
+        "--depth",
+        min=0,
+        help="Fetch depth for the PR branches in shallow clones (0 fetches full history)",
+    ),
+    remote_diff: bool = typer.Option(
+        False,
+        "--remote-diff",
+        help="Fetch the diff from the GitHub API instead of the local clone",
+    ),
+    repo_url: str = typer.Option(
+        None,
+        "--repo-url",
+        help="GitHub repository URL (required when --repo is not a git repository)",
+    ),
+    auto_clone: bool = typer.Option(
+        False,
+        "--auto-clone",
+        help="If --repo is not a git repository, collect from a cached bare clone of --repo-url",
+    ),
+    many: str = typer.Option(
+        None,
+        "--many",
+        help=(
+            "Comma-separated PR numbers to collect in one batch from the GitHub API "
+            "(e.g. 123,456,789)"
+        ),
+    ),
 ) -> None:
     """Collect PR diff and metadata into a markdown file."""
 
+    # Deferred so that `info`, `config` and `--help` don't pay for importing the app stack
+    from .app import collect_pr_data, collect_pr_data_batch, is_git_repo
+
     try:
         # Get token from CLI, environment, or config (in that order)
         github_token = token or get_github_token()
+        fetch_depth = depth if depth is not None else get_fetch_depth()
 
         # Handle output path
         final_output_path = None
@@ -63,7 +97,39 @@ def collect(
         # Resolve repo path
         repo_path = os.path.abspath(repo_path)
 
-        if pr_number is None:
+        pr_numbers: list[int] = []
+        if many:
+            if pr_number is not None:
+                raise ValueError("Pass either a PR number or --many, not both")
+            # Batches always use the API diff, so local-clone options have nothing to act on
+            if depth is not None or remote_diff or auto_clone:
+                raise ValueError(
+                    "--depth, --remote-diff and --auto-clone can't be used with --many"
+                )
+            try:
+                pr_numbers = [int(number) for number in many.split(",") if number.strip()]
+            except ValueError:
+                raise ValueError(f"Invalid PR number list: '{many}'")
+            if not pr_numbers:
+                raise ValueError(f"No PR numbers given in --many '{many}'")
+            if any(number < 1 for number in pr_numbers):
+                raise ValueError(f"PR numbers must be positive: '{many}'")
+            # Duplicates would write the same markdown file concurrently
+            pr_numbers = list(dict.fromkeys(pr_numbers))
+
+        if auto_clone and not is_git_repo(repo_path):
+            if not repo_url or pr_number is None:
+                raise ValueError("--auto-clone requires --repo-url and a PR number")
+
+            from .clone_cache import ensure_clone
+
+            console.print(f"[dim]Using cached clone of {repo_url}[/dim]")
+            # collect fetches the PR's branches itself, so skip refreshing the clone here
+            repo_path = str(ensure_clone(repo_url, fetch_depth, update=False))
+
+        if many:
+            console.print(f"[blue]Collecting PRs {many} from {repo_path}[/blue]")
+        elif pr_number is None:
             console.print(f"[blue]Auto-detecting PR from current branch in {repo_path}[/blue]")
         else:
             console.print(f"[blue]Collecting PR #{pr_number} from {repo_path}[/blue]")
@@ -77,6 +143,39 @@ def collect(
             )
             console.print("[dim]Set token with: pr-collector config set-token <your_token>[/dim]")
 
+        if pr_numbers:
+            results = collect_pr_data_batch(
+                repo_path=repo_path,
+                pr_numbers=pr_numbers,
+                output_path=final_output_path,
+                target_dir=target_dir,
+                token=github_token,
+                repo_url=repo_url,
+                return_content=not silent,
+            )
+
+            if not silent:
+                for _, markdown_content in results:
+                    console.print(markdown_content)
+
+            output_files = [output_file for output_file, _ in results if output_file]
+            if output_files:
+                console.print(
+                    Panel.fit(
+                        f"✅ Collected {len(output_files)} PRs successfully!\n"
+                        "[bold]Files:[/bold]\n" + "\n".join(output_files),
+                        style="green",
+                    )
+                )
+            elif silent:
+                console.print(
+                    Panel.fit(
+                        "❌ Error: Silent mode requires --output to be specified", style="red"
+                    )
+                )
+                raise typer.Exit(1)
+            return
+
         # Collect PR data
         output_file, markdown_content = collect_pr_data(
             repo_path=repo_path,
@@ -84,6 +183,10 @@ def collect(
             output_path=final_output_path,
             target_dir=target_dir,
             token=github_token,
+            fetch_depth=fetch_depth,
+            remote_diff=remote_diff,
+            repo_url=repo_url,
+            return_content=not silent,
         )
 
         # Handle output - stdout is default unless silent mode
@@ -113,6 +216,8 @@ def collect(
 def info() -> None:
     """Show information about pr-collector."""
 
+    from .app import get_application_info
+
     metadata = get_application_info()
     info_text = (
         f"[bold blue]{metadata['name']}[/bold blue]\n\n"
@@ -125,7 +230,9 @@ def info() -> None:
 
 @app.command("config")
 def config_cmd(
-    action: str = typer.Argument(..., help="Action: show, set-token, set-output-dir, init"),
+    action: str = typer.Argument(
+        ..., help="Action: show, set-token, set-output-dir, set-fetch-depth, init"
+    ),
     value: str = typer.Argument(None, help="Value for set actions"),
 ) -> None:
     """Manage configuration settings."""
@@ -171,6 +278,16 @@ def config_cmd(
                 Panel.fit(f"✅ Default output directory set to: {expanded_path}", style="green")
             )
 
+        elif action == "set-fetch-depth":
+            if not value or not value.isdigit():
+                console.print(
+                    Panel.fit("❌ Error: Fetch depth must be a non-negative integer", style="red")
+                )
+                raise typer.Exit(1)
+
+            set_fetch_depth(int(value))
+            console.print(Panel.fit(f"✅ Fetch depth set to: {value}", style="green"))
+
         elif action == "init":
             ensure_config_exists()
             config_file = get_config_file()
@@ -181,7 +298,7 @@ def config_cmd(
         else:
             console.print(
                 Panel.fit(
-                    f"❌ Error: Unknown action '{action}'. Use: show, set-token, set-output-dir, init",
+                    f"❌ Error: Unknown action '{action}'. Use: show, set-token, set-output-dir, set-fetch-depth, init",
                     style="red",
                 )
             )
@@ -203,6 +320,8 @@ def list_prs_cmd(
 ) -> None:
     """List all open PRs for the repository."""
 
+    from .app import list_open_prs
+
     try:
         # Get token from CLI, environment, or config
         github_token = token or get_github_token()
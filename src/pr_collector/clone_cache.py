@@ -0,0 +1,65 @@
+"""Shared bare clones for collecting PRs without a local checkout."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from .config import DEFAULT_FETCH_DEPTH, get_config_dir
+
+
+def get_clones_dir() -> Path:
+    """Get the directory holding cached clones."""
+    return get_config_dir() / "clones"
+
+
+def get_clone_path(owner: str, repo_name: str) -> Path:
+    """Get the cached clone path for a GitHub repository."""
+    return get_clones_dir() / owner / repo_name
+
+
+def ensure_clone(
+    remote_url: str, depth: int | None = DEFAULT_FETCH_DEPTH, update: bool = True
+) -> Path:
+    """Return a cached bare clone of remote_url, creating it on first use.
+
+    New clones are shallow (unless depth is 0/None) and blobless, so only the commits and
+    trees are downloaded up front; `git diff` later fetches just the blobs it touches.
+    Existing clones are fetched again when ``update`` is set.
+    """
+    import git
+
+    from .app import parse_github_url
+
+    owner, repo_name = parse_github_url(remote_url)
+    clone_path = get_clone_path(owner, repo_name)
+    depth_args = [f"--depth={depth}"] if depth else []
+
+    if clone_path.exists():
+        if update:
+            git.cmd.Git(str(clone_path)).fetch("origin", *depth_args)
+        return clone_path
+
+    clone_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Clone next to the final location and rename, so concurrent runs never see a partial clone
+    tmp_path = Path(tempfile.mkdtemp(dir=clone_path.parent, prefix=f".{repo_name}-"))
+    try:
+        git.cmd.Git().clone("--bare", *depth_args, "--filter=blob:none", remote_url, str(tmp_path))
+
+        # Bare clones have no fetch refspec; map branches to origin/* like a normal clone
+        git.cmd.Git(str(tmp_path)).config(
+            "remote.origin.fetch", "+refs/heads/*:refs/remotes/origin/*"
+        )
+
+        os.rename(tmp_path, clone_path)
+    except OSError:
+        # Another run finished cloning first; use its clone
+        if not clone_path.exists():
+            raise
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+    return clone_path
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    # libyaml's loader is several times faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader
+
 DEFAULT_CONFIG_DIR = Path.home() / ".pr-collector"
 DEFAULT_CONFIG_FILE = DEFAULT_CONFIG_DIR / "config.yaml"
+DEFAULT_FETCH_DEPTH = 50
 
 
 def get_config_dir() -> Path:
@@ -23,20 +31,29 @@ def get_config_file() -> Path:
     return config_dir / "config.yaml"
 
 
+@functools.lru_cache(maxsize=1)
+def _load_config_cached(config_path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse the config file; cached per path and modification time."""
+    try:
+        with open(config_path) as f:
+            return yaml.load(f, Loader=SafeLoader) or {}
+    except Exception:
+        # If config file is corrupted, return empty config
+        return {}
+
+
 def load_config() -> dict[str, Any]:
     """Load configuration from file."""
     config_file = get_config_file()
 
-    if not config_file.exists():
-        return {}
-
     try:
-        with config_file.open("r") as f:
-            return yaml.safe_load(f) or {}
-    except Exception:
-        # If config file is corrupted, return empty config
+        mtime_ns = config_file.stat().st_mtime_ns
+    except OSError:
         return {}
 
+    # Copy so callers can modify the result without touching the cached value
+    return dict(_load_config_cached(str(config_file), mtime_ns))
+
 
 def save_config(config: dict[str, Any]) -> None:
     """Save configuration to file."""
@@ -49,6 +66,9 @@ def save_config(config: dict[str, Any]) -> None:
     with config_file.open("w") as f:
         yaml.safe_dump(config, f, default_flow_style=False)
 
+    # The mtime may not change within the filesystem's timestamp resolution
+    _load_config_cached.cache_clear()
+
 
 def get_github_token() -> str | None:
     """Get GitHub token from config, environment, or return None."""
@@ -67,6 +87,11 @@ def set_github_token(token: str) -> None:
     config["github_token"] = token
     save_config(config)
 
+    # Cached responses may have been fetched with a different token's visibility
+    from .cache import clear_cache
+
+    clear_cache()
+
 
 def get_default_output_dir() -> str:
     """Get default output directory from config."""
@@ -81,11 +106,25 @@ def set_default_output_dir(output_dir: str) -> None:
     save_config(config)
 
 
+def get_fetch_depth() -> int:
+    """Get the shallow fetch depth from config (0 disables shallow fetching)."""
+    config = load_config()
+    return int(config.get("fetch_depth", DEFAULT_FETCH_DEPTH))
+
+
+def set_fetch_depth(depth: int) -> None:
+    """Set the shallow fetch depth in config."""
+    config = load_config()
+    config["fetch_depth"] = depth
+    save_config(config)
+
+
 def create_default_config() -> dict[str, Any]:
     """Create a default configuration."""
     return {
         "github_token": None,
         "default_output_dir": ".",
+        "fetch_depth": DEFAULT_FETCH_DEPTH,
     }
 
 
@@ -0,0 +1,76 @@
+"""GitHub API rate-limit pacing for pr-collector."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+
+# Longest we will wait for GitHub to lift a rate limit before letting the request fail
+MAX_RATE_LIMIT_WAIT = 60.0
+
+RATE_LIMITED_STATUSES = (403, 429)
+
+
+class GitHubRateLimiter:
+    """Paces GitHub API requests using the rate-limit headers of earlier responses.
+
+    Responses carrying ``Retry-After``, or ``X-RateLimit-Remaining: 0`` with an
+    ``X-RateLimit-Reset`` time, pause every subsequent request until the limit lifts.
+    One limiter is shared by the sync and async request paths.
+    """
+
+    def __init__(self, max_wait: float = MAX_RATE_LIMIT_WAIT) -> None:
+        self.max_wait = max_wait
+        self._resume_at = 0.0
+
+    def _requested_delay(self, response: httpx.Response) -> float | None:
+        """Seconds GitHub asks us to wait after this response, if any."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                return None
+
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                reset = float(response.headers["X-RateLimit-Reset"])
+            except (KeyError, ValueError):
+                return None
+            return max(reset - time.time(), 0.0)
+
+        return None
+
+    def update(self, response: httpx.Response) -> None:
+        """Record any pause requested by a response."""
+        delay = self._requested_delay(response)
+        if delay is not None and delay <= self.max_wait:
+            self._resume_at = max(self._resume_at, time.time() + delay)
+
+    def should_retry(self, response: httpx.Response) -> bool:
+        """Whether a response was rate limited with a wait short enough to retry after."""
+        if response.status_code not in RATE_LIMITED_STATUSES:
+            return False
+        delay = self._requested_delay(response)
+        return delay is not None and delay <= self.max_wait
+
+    async def on_response(self, response: httpx.Response) -> None:
+        """httpx event hook recording rate-limit headers from async responses."""
+        self.update(response)
+
+    def wait(self) -> None:
+        """Block until any requested pause has elapsed."""
+        delay = self._resume_at - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire(self) -> None:
+        """Wait, without blocking the event loop, until any requested pause has elapsed."""
+        delay = self._resume_at - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+rate_limiter = GitHubRateLimiter()
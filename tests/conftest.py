@@ -0,0 +1,80 @@
+"""Shared fixtures for pr_collector tests."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import git
+import httpx
+import pytest
+
+from pr_collector import app as app_module
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+PR_INFO = {
+    "title": "Add feature",
+    "description": "Adds the feature.",
+    "author": "octocat",
+    "created_at": "2024-05-01T12:00:00+00:00",
+    "updated_at": "2024-05-02T08:30:00+00:00",
+    "state": "open",
+    "base_branch": "main",
+    "head_branch": "feature",
+    "url": "https://github.com/owner/repo/pull/7",
+    "number": "7",
+}
+
+
+@pytest.fixture()
+def config_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Use a temporary config directory without a GITHUB_TOKEN override."""
+
+    monkeypatch.setenv("PR_COLLECTOR_CONFIG_DIR", str(tmp_path))
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    return tmp_path
+
+
+@pytest.fixture()
+def use_transport(monkeypatch: pytest.MonkeyPatch) -> Callable[[Handler], None]:
+    """Route the app module's async HTTP clients through a mock transport handler."""
+
+    real_client = httpx.AsyncClient
+
+    def install(handler: Handler) -> None:
+        def client_factory(**kwargs: object) -> httpx.AsyncClient:
+            return real_client(transport=httpx.MockTransport(handler), **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(app_module.httpx, "AsyncClient", client_factory)
+
+    return install
+
+
+def commit_file(repo: git.Repo, name: str, content: str) -> None:
+    """Write a file in a repository's working tree and commit it."""
+
+    path = Path(repo.working_tree_dir or ".") / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    repo.index.add([name])
+    repo.index.commit(f"Update {name}")
+
+
+@pytest.fixture()
+def origin_url(tmp_path: Path) -> str:
+    """Create an origin with a long main history and a feature branch; return its URL."""
+
+    origin = git.Repo.init(tmp_path / "origin", initial_branch="main")
+    with origin.config_writer() as writer:
+        writer.set_value("user", "name", "Test")
+        writer.set_value("user", "email", "test@example.com")
+        writer.set_value("uploadpack", "allowFilter", "true")
+
+    for i in range(10):
+        commit_file(origin, "history.txt", f"history {i}\n")
+
+    origin.git.checkout("-b", "feature")
+    commit_file(origin, "src/feature.py", "print('feature')\n")
+    commit_file(origin, "docs/notes.md", "notes\n")
+    origin.git.checkout("main")
+
+    return f"file://{tmp_path / 'origin'}"
@@ -0,0 +1,121 @@
+"""Tests for collecting several PRs in one batch."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from pr_collector import app as app_module
+from pr_collector.app import collect_pr_data_batch
+from pr_collector.cli import app
+
+
+def _node(number: int) -> dict[str, Any]:
+    return {
+        "number": number,
+        "title": f"Change {number}",
+        "body": "",
+        "author": {"login": "octocat"},
+        "createdAt": "2024-05-01T12:00:00Z",
+        "updatedAt": "2024-05-02T08:30:00Z",
+        "state": "MERGED" if number == 2 else "OPEN",
+        "baseRefName": "main",
+        "headRefName": f"branch-{number}",
+        "url": f"https://github.com/owner/repo/pull/{number}",
+    }
+
+
+def test_collect_pr_data_batch(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_transport: Callable[..., None]
+) -> None:
+    """Metadata comes from one GraphQL query and each diff from its own request."""
+
+    queries: list[str] = []
+
+    def fake_post(url: str, **kwargs: Any) -> httpx.Response:
+        queries.append(kwargs["json"]["query"])
+        data = {"repository": {"pr1": _node(1), "pr2": _node(2)}}
+        return httpx.Response(200, json={"data": data}, request=httpx.Request("POST", url))
+
+    diff_paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        diff_paths.append(request.url.path)
+        assert request.headers["Accept"] == "application/vnd.github.v3.diff"
+        number = request.url.path.rsplit("/", 1)[1]
+        return httpx.Response(200, text=f"diff --git a/f{number} b/f{number}\n+change\n")
+
+    monkeypatch.setattr(app_module.httpx, "post", fake_post)
+    use_transport(handler)
+
+    results = collect_pr_data_batch(
+        str(tmp_path),
+        [1, 2],
+        output_path=str(tmp_path / "out"),
+        token="secret",
+        repo_url="https://github.com/owner/repo",
+    )
+
+    assert len(queries) == 1
+    assert "pr1: pullRequest(number: 1)" in queries[0]
+    assert sorted(diff_paths) == ["/repos/owner/repo/pulls/1", "/repos/owner/repo/pulls/2"]
+
+    (first_file, first_content), (second_file, second_content) = results
+    assert first_file == str(tmp_path / "out" / "pr-1-Change-1.md")
+    assert Path(first_file).read_text() == first_content
+    assert first_content is not None and "diff --git a/f1 b/f1" in first_content
+    # The API's trailing newline is dropped, as for local and single-PR remote diffs
+    assert first_content.endswith("+change\n```")
+    # Merged PRs render the same way as through the REST API
+    assert second_content is not None and "**PR #2** - Closed" in second_content
+
+
+@pytest.mark.usefixtures("config_dir")
+@pytest.mark.parametrize(
+    ("args", "message"),
+    [
+        (["--many", ","], "No PR numbers"),
+        (["--many", "3,-1"], "must be positive"),
+        (["--many", "0"], "must be positive"),
+        (["--many", "1,2", "--depth", "10"], "can't be used with --many"),
+        (["--many", "1,2", "--remote-diff"], "can't be used with --many"),
+        (["--many", "1,2", "--auto-clone"], "can't be used with --many"),
+    ],
+)
+def test_collect_many_rejects_invalid_options(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, args: list[str], message: str
+) -> None:
+    """Empty batches and options that only apply to single-PR collection are rejected."""
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("collect_pr_data_batch should not be called")
+
+    monkeypatch.setattr(app_module, "collect_pr_data_batch", fail)
+
+    result = CliRunner().invoke(app, ["collect", "--repo", str(tmp_path), *args])
+
+    assert result.exit_code == 1
+    assert message in result.output
+
+
+@pytest.mark.usefixtures("config_dir")
+def test_collect_many_drops_duplicate_numbers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeated PR numbers are collected once, in first-seen order."""
+
+    calls: list[list[int]] = []
+
+    def fake_batch(**kwargs: Any) -> list[tuple[str | None, str | None]]:
+        calls.append(kwargs["pr_numbers"])
+        return [(None, "markdown") for _ in kwargs["pr_numbers"]]
+
+    monkeypatch.setattr(app_module, "collect_pr_data_batch", fake_batch)
+
+    result = CliRunner().invoke(app, ["collect", "--repo", str(tmp_path), "--many", "5,3,5"])
+
+    assert result.exit_code == 0
+    assert calls == [[5, 3]]
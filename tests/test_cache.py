@@ -0,0 +1,86 @@
+"""Tests for the on-disk response cache."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from pr_collector import cache as cache_module
+from pr_collector.cache import DiskCache, clear_cache, ttl_cached
+
+pytestmark = pytest.mark.usefixtures("config_dir")
+
+
+def test_disk_cache_round_trip(tmp_path: Path) -> None:
+    """Stored values are returned until they expire."""
+
+    disk_cache = DiskCache(tmp_path / "entries")
+    disk_cache.set("key", {"title": "Add feature"})
+
+    assert disk_cache.get("key", ttl=60) == {"title": "Add feature"}
+    assert disk_cache.get("key", ttl=-1) is None
+    assert disk_cache.get("missing", default="fallback") == "fallback"
+
+
+def test_disk_cache_ignores_corrupted_entries(tmp_path: Path) -> None:
+    """Corrupted entries are treated as misses."""
+
+    disk_cache = DiskCache(tmp_path)
+    disk_cache.set("key", "value")
+    next(tmp_path.glob("*.json")).write_text("{not json")
+
+    assert disk_cache.get("key") is None
+
+
+def test_disk_cache_deletes_expired_entries(tmp_path: Path) -> None:
+    """An expired lookup removes the entry from disk."""
+
+    disk_cache = DiskCache(tmp_path)
+    disk_cache.set("key", "value")
+
+    assert disk_cache.get("key", ttl=-1) is None
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_disk_cache_prunes_old_entries_on_write(tmp_path: Path) -> None:
+    """Writes remove entries older than max_age, including ones stored without a TTL."""
+
+    disk_cache = DiskCache(tmp_path, max_age=60)
+    disk_cache.set("old", "value")
+    old_entry = next(tmp_path.glob("*.json"))
+    stale = time.time() - 120
+    os.utime(old_entry, (stale, stale))
+
+    disk_cache.set("new", "value")
+
+    assert not old_entry.exists()
+    assert disk_cache.get("new") == "value"
+
+
+def test_ttl_cached_reuses_results(config_dir: Path) -> None:
+    """Repeated calls with the same key hit the cache; None results are not stored."""
+
+    calls: list[int] = []
+
+    @ttl_cached(key=lambda number, token=None: (number,), ttl=60)
+    def lookup(number: int, token: str | None = None) -> dict[str, int] | None:
+        calls.append(number)
+        return {"number": number} if number else None
+
+    assert lookup(1, token="a") == {"number": 1}
+    assert lookup(1, token="b") == {"number": 1}
+    assert lookup(0) is None
+    assert lookup(0) is None
+
+    assert calls == [1, 0, 0]
+    assert (config_dir / "http-cache").is_dir()
+
+
+def test_clear_cache_removes_entries(config_dir: Path) -> None:
+    """Clearing the shared cache drops stored entries."""
+
+    cache_module.cache.set("key", "value")
+    clear_cache()
+
+    assert cache_module.cache.get("key") is None
@@ -0,0 +1,52 @@
+"""Tests for the shared bare clone cache."""
+
+from pathlib import Path
+
+import git
+import pytest
+
+from pr_collector import app as app_module
+from pr_collector.app import collect_pr_data, is_git_repo
+from pr_collector.clone_cache import ensure_clone
+
+from .conftest import PR_INFO
+
+pytestmark = pytest.mark.usefixtures("config_dir")
+
+
+@pytest.fixture(autouse=True)
+def owner_repo(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Map the file:// test origin to a GitHub owner and repository."""
+
+    monkeypatch.setattr(app_module, "parse_github_url", lambda url: ("owner", "repo"))
+
+
+def test_ensure_clone_creates_shallow_bare_clone(origin_url: str, config_dir: Path) -> None:
+    """The first call clones into the cache; later calls reuse the same clone."""
+
+    clone_path = ensure_clone(origin_url, depth=1)
+
+    assert clone_path == config_dir / "clones" / "owner" / "repo"
+    assert is_git_repo(str(clone_path))
+    clone = git.cmd.Git(str(clone_path))
+    assert clone.rev_parse("--is-bare-repository") == "true"
+    assert clone.rev_parse("--is-shallow-repository") == "true"
+
+    assert ensure_clone(origin_url, depth=1) == clone_path
+    assert clone.rev_parse("origin/main")
+    assert not list(clone_path.parent.glob(".repo-*"))
+
+
+def test_collect_pr_data_from_cached_clone(
+    origin_url: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A PR diff can be collected straight from the bare clone."""
+
+    monkeypatch.setattr(app_module, "get_pr_info", lambda *args: PR_INFO)
+    clone_path = ensure_clone(origin_url, depth=1, update=False)
+
+    _, content = collect_pr_data(str(clone_path), 7, target_dir="src", fetch_depth=1)
+
+    assert content is not None
+    assert "print('feature')" in content
+    assert "docs/notes.md" not in content
@@ -0,0 +1,63 @@
+"""Tests for configuration management."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pr_collector.config import (
+    get_fetch_depth,
+    get_github_token,
+    load_config,
+    save_config,
+    set_fetch_depth,
+)
+
+pytestmark = pytest.mark.usefixtures("config_dir")
+
+
+def test_load_config_missing_file() -> None:
+    """A missing config file loads as an empty config."""
+
+    assert load_config() == {}
+
+
+def test_load_config_sees_saved_changes() -> None:
+    """Saving invalidates the cached config."""
+
+    save_config({"github_token": "first"})
+    assert get_github_token() == "first"
+
+    save_config({"github_token": "second"})
+    assert get_github_token() == "second"
+
+
+def test_load_config_returns_independent_copies() -> None:
+    """Mutating a loaded config does not leak into later loads."""
+
+    save_config({"default_output_dir": "."})
+    load_config()["default_output_dir"] = "/tmp"
+
+    assert load_config() == {"default_output_dir": "."}
+
+
+def test_load_config_picks_up_external_edits(config_dir: Path) -> None:
+    """Edits made outside save_config are detected through the file's mtime."""
+
+    set_fetch_depth(10)
+    assert get_fetch_depth() == 10
+
+    config_file = config_dir / "config.yaml"
+    stat = config_file.stat()
+    config_file.write_text("fetch_depth: 20\n")
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert get_fetch_depth() == 20
+
+
+def test_load_config_corrupted_file(config_dir: Path) -> None:
+    """A corrupted config file loads as an empty config."""
+
+    (config_dir / "config.yaml").write_text("github_token: [unclosed\n")
+
+    assert load_config() == {}
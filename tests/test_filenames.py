@@ -0,0 +1,34 @@
+"""Tests for filename sanitization."""
+
+import re
+
+import pytest
+
+from pr_collector.app import sanitize_filename
+
+
+def _reference_sanitize(filename: str) -> str:
+    """The original two-pass implementation."""
+
+    sanitized = re.sub(r"[^\w\s\-_.]", "", filename)
+    sanitized = re.sub(r"[-\s]+", "-", sanitized)
+    return sanitized.strip("-")
+
+
+@pytest.mark.parametrize(
+    "title",
+    [
+        "Add feature",
+        "Fix: crash on  startup!",
+        "a-!-b",
+        "a!b",
+        "  --Leading and trailing--  ",
+        "feat(api): v1.2 [WIP] ~ test",
+        "Ünïcödé title — with dash",
+        "***",
+    ],
+)
+def test_sanitize_filename_matches_two_pass(title: str) -> None:
+    """The fused single-pass sanitizer matches the original two-pass behaviour."""
+
+    assert sanitize_filename(title) == _reference_sanitize(title)
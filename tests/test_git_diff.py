@@ -0,0 +1,281 @@
+"""Tests for git diff collection against a local remote."""
+
+import errno
+import io
+import os
+import threading
+from pathlib import Path
+
+import git
+import pytest
+
+from pr_collector import app as app_module
+from pr_collector.app import (
+    collect_pr_data,
+    fetch_pr_branches,
+    get_current_pr_number,
+    get_git_diff,
+    write_git_diff,
+)
+
+from .conftest import PR_INFO, commit_file
+
+
+@pytest.fixture()
+def cloned_repo(origin_url: str, tmp_path: Path) -> git.Repo:
+    """Shallow-clone the origin's main branch."""
+
+    return git.Repo.clone_from(origin_url, tmp_path / "clone", depth=1)
+
+
+def test_get_git_diff_deepens_shallow_fetch(cloned_repo: git.Repo) -> None:
+    """A shallow fetch too short for the merge base is deepened until the diff resolves."""
+
+    diff = get_git_diff(str(cloned_repo.working_tree_dir), "main", "feature", depth=1)
+
+    assert "src/feature.py" in diff
+    assert "docs/notes.md" in diff
+    assert "history.txt" not in diff
+
+
+def test_get_git_diff_target_dir(cloned_repo: git.Repo) -> None:
+    """Diffs can be limited to a single directory."""
+
+    diff = get_git_diff(str(cloned_repo.working_tree_dir), "main", "feature", "src")
+
+    assert "src/feature.py" in diff
+    assert "docs/notes.md" not in diff
+
+
+def test_get_git_diff_full_fetch(cloned_repo: git.Repo) -> None:
+    """A depth of zero fetches full history."""
+
+    diff = get_git_diff(str(cloned_repo.working_tree_dir), "main", "feature", depth=0)
+
+    assert "src/feature.py" in diff
+
+
+class RecordingGit(git.cmd.Git):
+    """Git command runner that records the keyword arguments of each fetch."""
+
+    def __init__(self, working_dir: str) -> None:
+        super().__init__(working_dir)
+        self.fetches: list[dict[str, object]] = []
+
+    def fetch(self, *args: str, **kwargs: object) -> str:
+        self.fetches.append(kwargs)
+        return self._call_process("fetch", *args, **kwargs)
+
+
+def test_get_git_diff_keeps_full_clone_full(origin_url: str, tmp_path: Path) -> None:
+    """A full clone is never made shallow, however far behind origin it is."""
+
+    clone = git.Repo.clone_from(origin_url, tmp_path / "clone")
+    origin = git.Repo(origin_url.removeprefix("file://"))
+    for i in range(5):
+        commit_file(origin, "history.txt", f"more history {i}\n")
+
+    diff = get_git_diff(str(clone.working_tree_dir), "main", "feature", depth=1)
+
+    assert "src/feature.py" in diff
+    assert clone.git.rev_parse("--is-shallow-repository") == "false"
+    assert clone.git.rev_list("--count", "origin/main") == "15"
+
+
+def test_fetch_pr_branches_tries_requested_depth(cloned_repo: git.Repo) -> None:
+    """Depths above the doubling limit are still tried before unshallowing."""
+
+    git_cmd = RecordingGit(str(cloned_repo.working_tree_dir))
+
+    fetch_pr_branches(git_cmd, "main", "feature", depth=5000)
+
+    assert git_cmd.fetches == [{"depth": 5000}]
+
+
+def test_fetch_pr_branches_keeps_deepened_history(cloned_repo: git.Repo) -> None:
+    """Later runs keep the shallow boundary earlier runs deepened instead of redoing it."""
+
+    git_cmd = RecordingGit(str(cloned_repo.working_tree_dir))
+    fetch_pr_branches(git_cmd, "main", "feature", depth=1)
+    assert git_cmd.fetches[0] == {"depth": 1}
+    assert len(git_cmd.fetches) > 1
+    assert all("deepen" in fetch for fetch in git_cmd.fetches[1:])
+
+    git_cmd.fetches.clear()
+    fetch_pr_branches(git_cmd, "main", "feature", depth=1)
+
+    assert git_cmd.fetches == [{}]
+
+
+def test_fetch_pr_branches_zero_depth_unshallows(cloned_repo: git.Repo) -> None:
+    """A depth of zero fetches the full history of a shallow clone."""
+
+    git_cmd = RecordingGit(str(cloned_repo.working_tree_dir))
+
+    fetch_pr_branches(git_cmd, "main", "feature", depth=0)
+
+    assert git_cmd.fetches == [{"unshallow": True}]
+    assert git_cmd.rev_parse("--is-shallow-repository") == "false"
+
+
+def test_write_git_diff_matches_get_git_diff(cloned_repo: git.Repo) -> None:
+    """Streaming the diff writes exactly the string get_git_diff returns."""
+
+    repo_path = str(cloned_repo.working_tree_dir)
+    out = io.BytesIO()
+    write_git_diff(repo_path, "main", "feature", out)
+
+    assert out.getvalue().decode() == get_git_diff(repo_path, "main", "feature")
+
+
+@pytest.mark.parametrize("kernel_copy", [True, False])
+def test_write_git_diff_to_file(
+    cloned_repo: git.Repo, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, kernel_copy: bool
+) -> None:
+    """Writing to a regular file matches get_git_diff with and without the kernel copy."""
+
+    if not kernel_copy:
+
+        def unsupported(in_fd: int, out_fd: int) -> int:
+            raise OSError(errno.EINVAL, "Invalid argument")
+
+        monkeypatch.setattr(app_module, "_kernel_copy", unsupported)
+
+    repo_path = str(cloned_repo.working_tree_dir)
+    path = tmp_path / "diff.md"
+    with open(path, "w+b") as f:
+        f.write(b"header\n")
+        write_git_diff(repo_path, "main", "feature", f)
+        f.write(b"footer")
+
+    expected = f"header\n{get_git_diff(repo_path, 'main', 'feature')}footer"
+    assert path.read_text() == expected
+
+
+@pytest.mark.parametrize("return_content", [True, False])
+def test_collect_pr_data_writes_markdown(
+    cloned_repo: git.Repo,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    return_content: bool,
+) -> None:
+    """Streamed and in-memory collection produce the same markdown file."""
+
+    monkeypatch.setattr(app_module, "get_pr_info", lambda *args: PR_INFO)
+    repo_path = str(cloned_repo.working_tree_dir)
+
+    output_file, content = collect_pr_data(
+        repo_path, 7, output_path=f"{tmp_path}/out/", return_content=return_content
+    )
+
+    assert output_file == str(tmp_path / "out" / "pr-7-Add-feature.md")
+    expected = app_module.generate_markdown(
+        PR_INFO, get_git_diff(repo_path, "main", "feature"), None
+    )
+    assert Path(output_file).read_text() == expected
+    assert content == (expected if return_content else None)
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+def test_collect_pr_data_streams_to_fifo(
+    cloned_repo: git.Repo, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Streaming collection also works when the output is a pipe rather than a file."""
+
+    monkeypatch.setattr(app_module, "get_pr_info", lambda *args: PR_INFO)
+    repo_path = str(cloned_repo.working_tree_dir)
+    path = tmp_path / "pr.fifo"
+    os.mkfifo(path)
+    received: list[str] = []
+    reader = threading.Thread(target=lambda: received.append(path.read_text()), daemon=True)
+    reader.start()
+
+    collect_pr_data(repo_path, 7, output_path=str(path), return_content=False)
+    reader.join(timeout=10)
+
+    expected = app_module.generate_markdown(
+        PR_INFO, get_git_diff(repo_path, "main", "feature"), None
+    )
+    assert received == [expected]
+
+
+def test_collect_pr_data_sees_new_head_commits(
+    cloned_repo: git.Repo, origin_url: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A head branch outside the clone's refspec is refreshed on every run."""
+
+    monkeypatch.setattr(app_module, "get_pr_info", lambda *args: PR_INFO)
+    repo_path = str(cloned_repo.working_tree_dir)
+    _, first = collect_pr_data(repo_path, 7)
+
+    origin = git.Repo(origin_url.removeprefix("file://"))
+    origin.git.checkout("feature")
+    commit_file(origin, "src/later.py", "print('later')\n")
+    origin.git.checkout("main")
+
+    _, second = collect_pr_data(repo_path, 7)
+
+    assert first is not None and "src/later.py" not in first
+    assert second is not None and "src/later.py" in second
+
+
+def test_collect_pr_data_skips_targeted_fetch_for_full_clone(
+    origin_url: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Branches covered by the clone's refspec aren't fetched a second time."""
+
+    clone = git.Repo.clone_from(origin_url, tmp_path / "clone")
+    monkeypatch.setattr(app_module, "get_pr_info", lambda *args: PR_INFO)
+    targeted: list[tuple[str, str]] = []
+    monkeypatch.setattr(
+        app_module,
+        "fetch_pr_branches",
+        lambda git_cmd, base, head, depth: targeted.append((base, head)),
+    )
+
+    _, content = collect_pr_data(str(clone.working_tree_dir), 7)
+
+    assert content is not None and "src/feature.py" in content
+    assert targeted == []
+
+
+@pytest.mark.parametrize(
+    ("refspecs", "covered"),
+    [
+        (["+refs/heads/*:refs/remotes/origin/*"], True),
+        (["+refs/heads/main:refs/remotes/origin/main"], False),
+        (["+refs/heads/feat*:refs/remotes/origin/feat*"], True),
+        (["+refs/heads/*:refs/remotes/origin/*", "^refs/heads/feature"], False),
+    ],
+)
+def test_fetched_by_refspec(cloned_repo: git.Repo, refspecs: list[str], covered: bool) -> None:
+    """Exact, glob and negative refspecs are all taken into account."""
+
+    cloned_repo.git.config("--unset-all", "remote.origin.fetch")
+    for refspec in refspecs:
+        cloned_repo.git.config("--add", "remote.origin.fetch", refspec)
+
+    git_cmd = git.cmd.Git(str(cloned_repo.working_tree_dir))
+    assert app_module._fetched_by_refspec(git_cmd, "feature") is covered
+
+
+def test_get_current_pr_number_uses_upstream_branch(
+    cloned_repo: git.Repo, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The PR lookup uses the origin repository and the upstream branch name."""
+
+    cloned_repo.git.remote("set-url", "origin", "git@github.com:owner/repo.git")
+    cloned_repo.git.checkout("-b", "local-feature")
+    cloned_repo.git.config("branch.local-feature.remote", "origin")
+    cloned_repo.git.config("branch.local-feature.merge", "refs/heads/feature")
+
+    lookups: list[tuple[str, str, str]] = []
+
+    def fake_find(owner: str, repo_name: str, branch: str, token: str | None = None) -> int:
+        lookups.append((owner, repo_name, branch))
+        return 7
+
+    monkeypatch.setattr(app_module, "find_pr_for_branch", fake_find)
+
+    assert get_current_pr_number(str(cloned_repo.working_tree_dir)) == 7
+    assert lookups == [("owner", "repo", "feature")]
@@ -0,0 +1,101 @@
+"""Tests for listing open PRs."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from pr_collector import app as app_module
+from pr_collector.app import _fetch_prs, _graphql_list_prs
+
+
+def _pull(number: int) -> dict[str, object]:
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "head": {"ref": f"branch-{number}"},
+        "user": {"login": "octocat"},
+        "created_at": "2024-05-01T12:00:00Z",
+        "html_url": f"https://github.com/owner/repo/pull/{number}",
+    }
+
+
+def test_fetch_prs_reads_all_pages(use_transport: Callable[..., None]) -> None:
+    """Pages after the first are discovered from the Link header and fetched."""
+
+    requested_pages: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = request.url.params.get("page", "1")
+        requested_pages.append(page)
+        headers = {}
+        if page == "1":
+            headers["Link"] = (
+                '<https://api.github.com/repos/owner/repo/pulls?page=2>; rel="next", '
+                '<https://api.github.com/repos/owner/repo/pulls?page=3>; rel="last"'
+            )
+        return httpx.Response(200, json=[_pull(int(page))], headers=headers)
+
+    use_transport(handler)
+
+    pulls = asyncio.run(_fetch_prs("owner", "repo", "secret"))
+
+    assert [pr["number"] for pr in pulls] == [1, 2, 3]
+    assert sorted(requested_pages) == ["1", "2", "3"]
+
+
+def test_fetch_prs_retries_after_rate_limit(use_transport: Callable[..., None]) -> None:
+    """A rate-limited response with Retry-After is retried."""
+
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        if len(calls) == 1:
+            return httpx.Response(403, headers={"Retry-After": "0"})
+        return httpx.Response(200, json=[_pull(1)])
+
+    use_transport(handler)
+
+    pulls = asyncio.run(_fetch_prs("owner", "repo"))
+
+    assert len(calls) == 2
+    assert pulls[0]["number"] == 1
+
+
+def test_graphql_list_prs_follows_cursor(monkeypatch: pytest.MonkeyPatch) -> None:
+    """GraphQL pages are followed via endCursor and mapped to the listing shape."""
+
+    cursors: list[object] = []
+
+    def fake_post(url: str, **kwargs: Any) -> httpx.Response:
+        cursor = kwargs["json"]["variables"]["cursor"]
+        cursors.append(cursor)
+        node = {
+            "number": 1 if cursor is None else 2,
+            "title": "Add feature",
+            "headRefName": "feature",
+            "author": {"login": "octocat"} if cursor is None else None,
+            "createdAt": "2024-05-01T12:00:00Z",
+            "url": "https://github.com/owner/repo/pull/1",
+        }
+        page_info = {"hasNextPage": cursor is None, "endCursor": "abc"}
+        data = {"repository": {"pullRequests": {"pageInfo": page_info, "nodes": [node]}}}
+        return httpx.Response(200, json={"data": data}, request=httpx.Request("POST", url))
+
+    monkeypatch.setattr(app_module.httpx, "post", fake_post)
+
+    prs = _graphql_list_prs("owner", "repo", "secret")
+
+    assert cursors == [None, "abc"]
+    assert prs[0] == {
+        "number": "1",
+        "title": "Add feature",
+        "branch": "feature",
+        "author": "octocat",
+        "created": "2024-05-01",
+        "url": "https://github.com/owner/repo/pull/1",
+    }
+    assert prs[1]["author"] == "ghost"
@@ -0,0 +1,76 @@
+"""Tests for markdown generation."""
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from pr_collector.app import generate_markdown, write_markdown_file
+
+from .conftest import PR_INFO
+
+DIFF = "diff --git a/a.txt b/a.txt\n--- a/a.txt\n+++ b/a.txt\n@@ -1 +1 @@\n-old\n+new"
+
+
+def _reference_markdown(pr_info: dict[str, str], diff: str, target_dir: str | None) -> str:
+    """The original list-and-join implementation."""
+
+    lines = [
+        f"# {pr_info['title']}",
+        "",
+        f"**PR #{pr_info['number']}** - {pr_info['state'].title()}",
+        f"**Author:** {pr_info['author']}",
+        f"**Created:** {pr_info['created_at']}",
+        f"**Updated:** {pr_info['updated_at']}",
+        f"**Base Branch:** {pr_info['base_branch']}",
+        f"**Head Branch:** {pr_info['head_branch']}",
+        f"**URL:** {pr_info['url']}",
+        "",
+    ]
+    if target_dir:
+        lines.extend([f"**Target Directory:** `{target_dir}`", ""])
+    if pr_info["description"].strip():
+        lines.extend(["## Description", "", pr_info["description"], ""])
+    lines.extend(["## Changes", "", "```diff", diff, "```"])
+    return "\n".join(lines)
+
+
+@pytest.mark.parametrize("target_dir", [None, "src"])
+@pytest.mark.parametrize("description", ["", "  \n", "Adds the feature."])
+def test_generate_markdown_layout(target_dir: str | None, description: str) -> None:
+    """Markdown output keeps the established layout."""
+
+    pr_info = {**PR_INFO, "description": description}
+
+    assert generate_markdown(pr_info, DIFF, target_dir) == _reference_markdown(
+        pr_info, DIFF, target_dir
+    )
+
+
+def test_write_markdown_file_matches_generate_markdown(tmp_path: Path) -> None:
+    """The memory-mapped writer lays out multi-byte text correctly."""
+
+    pr_info = {**PR_INFO, "title": "Añadir función ✨"}
+    diff = DIFF + "\n+héllo wörld"
+    path = tmp_path / "pr.md"
+
+    write_markdown_file(path, pr_info, diff, "src")
+
+    assert path.read_text(encoding="utf-8") == generate_markdown(pr_info, diff, "src")
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+def test_write_markdown_file_to_fifo(tmp_path: Path) -> None:
+    """Non-seekable outputs such as FIFOs get a plain buffered write."""
+
+    path = tmp_path / "pr.fifo"
+    os.mkfifo(path)
+    received: list[bytes] = []
+    reader = threading.Thread(target=lambda: received.append(path.read_bytes()), daemon=True)
+    reader.start()
+
+    write_markdown_file(path, PR_INFO, DIFF, "src")
+    reader.join(timeout=10)
+
+    assert received == [generate_markdown(PR_INFO, DIFF, "src").encode()]
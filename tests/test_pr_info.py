@@ -0,0 +1,126 @@
+"""Tests for fetching PR metadata."""
+
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from pr_collector import app as app_module
+from pr_collector.app import find_pr_for_branch, get_json_conditional, get_pr_info
+
+PR_JSON = {
+    "title": "Add feature",
+    "body": None,
+    "user": {"login": "octocat"},
+    "created_at": "2024-05-01T12:00:00Z",
+    "updated_at": "2024-05-02T08:30:00Z",
+    "state": "open",
+    "base": {"ref": "main"},
+    "head": {"ref": "feature"},
+    "html_url": "https://github.com/owner/repo/pull/7",
+    "number": 7,
+}
+
+
+pytestmark = pytest.mark.usefixtures("config_dir")
+
+
+def test_get_pr_info_maps_rest_fields(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The REST payload is mapped into the PR info shape."""
+
+    def fake_get(url: str, **kwargs: Any) -> httpx.Response:
+        return httpx.Response(200, json=PR_JSON, request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(app_module.httpx, "get", fake_get)
+
+    info = get_pr_info("https://github.com/owner/repo", 7, "secret")
+
+    assert info == {
+        "title": "Add feature",
+        "description": "",
+        "author": "octocat",
+        "created_at": "2024-05-01T12:00:00+00:00",
+        "updated_at": "2024-05-02T08:30:00+00:00",
+        "state": "open",
+        "base_branch": "main",
+        "head_branch": "feature",
+        "url": "https://github.com/owner/repo/pull/7",
+        "number": "7",
+    }
+
+
+def test_get_json_conditional_revalidates_with_etag(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A second request sends If-None-Match and reuses the cached body on 304."""
+
+    sent_etags: list[str | None] = []
+
+    def fake_get(url: str, **kwargs: Any) -> httpx.Response:
+        etag = kwargs["headers"].get("If-None-Match")
+        sent_etags.append(etag)
+        request = httpx.Request("GET", url)
+        if etag == '"abc"':
+            return httpx.Response(304, request=request)
+        return httpx.Response(200, json={"n": 1}, headers={"ETag": '"abc"'}, request=request)
+
+    monkeypatch.setattr(app_module.httpx, "get", fake_get)
+
+    url = "https://api.github.com/repos/owner/repo/pulls/7"
+    assert get_json_conditional(url) == {"n": 1}
+    assert get_json_conditional(url) == {"n": 1}
+    assert sent_etags == [None, '"abc"']
+
+
+def test_find_pr_for_branch_uses_head_filter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The owner-qualified head search asks for a single result and uses it."""
+
+    requested: list[httpx.URL] = []
+
+    def fake_get(url: str, **kwargs: Any) -> httpx.Response:
+        requested.append(httpx.URL(url))
+        return httpx.Response(200, json=[{"number": 12}], request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(app_module.httpx, "get", fake_get)
+
+    assert find_pr_for_branch("owner", "repo", "feature") == 12
+    assert len(requested) == 1
+    assert requested[0].params["head"] == "owner:feature"
+    assert requested[0].params["per_page"] == "1"
+
+
+def test_find_pr_for_branch_falls_back_to_graphql(monkeypatch: pytest.MonkeyPatch) -> None:
+    """With a token, the fork-friendly head branch match is done server-side."""
+
+    def fake_get(url: str, **kwargs: Any) -> httpx.Response:
+        return httpx.Response(200, json=[], request=httpx.Request("GET", url))
+
+    variables: list[dict[str, str]] = []
+
+    def fake_post(url: str, **kwargs: Any) -> httpx.Response:
+        variables.append(kwargs["json"]["variables"])
+        data = {"repository": {"pullRequests": {"nodes": [{"number": 42}]}}}
+        return httpx.Response(200, json={"data": data}, request=httpx.Request("POST", url))
+
+    monkeypatch.setattr(app_module.httpx, "get", fake_get)
+    monkeypatch.setattr(app_module.httpx, "post", fake_post)
+
+    assert find_pr_for_branch("owner", "repo", "feature", "secret") == 42
+    assert variables == [{"owner": "owner", "name": "repo", "branch": "feature"}]
+
+
+def test_find_pr_for_branch_scans_without_token(
+    monkeypatch: pytest.MonkeyPatch, use_transport: Callable[..., None]
+) -> None:
+    """Without a token, open PRs are scanned for a matching head branch."""
+
+    def fake_get(url: str, **kwargs: Any) -> httpx.Response:
+        return httpx.Response(200, json=[], request=httpx.Request("GET", url))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        pulls = [{"number": 5, "head": {"ref": "other"}}, {"number": 6, "head": {"ref": "feature"}}]
+        return httpx.Response(200, json=pulls)
+
+    monkeypatch.setattr(app_module.httpx, "get", fake_get)
+    use_transport(handler)
+
+    assert find_pr_for_branch("owner", "repo", "feature") == 6
@@ -0,0 +1,67 @@
+"""Tests for GitHub rate-limit pacing."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from pr_collector import ratelimit
+from pr_collector.ratelimit import GitHubRateLimiter
+
+
+def test_retry_after_is_honoured(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A Retry-After response pauses later requests and is retryable."""
+
+    sleeps: list[float] = []
+    monkeypatch.setattr(ratelimit.time, "sleep", sleeps.append)
+
+    limiter = GitHubRateLimiter()
+    response = httpx.Response(429, headers={"Retry-After": "5"})
+    limiter.update(response)
+
+    assert limiter.should_retry(response)
+    limiter.wait()
+    assert len(sleeps) == 1 and 4 < sleeps[0] <= 5
+
+
+def test_exhausted_budget_waits_for_reset(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A successful response with no remaining budget pauses until the reset time."""
+
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", fake_sleep)
+
+    limiter = GitHubRateLimiter()
+    reset = str(int(time.time()) + 10)
+    response = httpx.Response(
+        200, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}
+    )
+    limiter.update(response)
+
+    assert not limiter.should_retry(response)
+    asyncio.run(limiter.acquire())
+    assert len(sleeps) == 1 and 8 < sleeps[0] <= 10
+
+
+def test_long_waits_are_not_retried() -> None:
+    """Limits that lift later than max_wait are left to fail rather than stall."""
+
+    limiter = GitHubRateLimiter(max_wait=60)
+    reset = str(int(time.time()) + 3600)
+    response = httpx.Response(
+        403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}
+    )
+    limiter.update(response)
+
+    assert not limiter.should_retry(response)
+    assert limiter._resume_at == 0.0
+
+
+def test_forbidden_without_rate_limit_headers_is_not_retried() -> None:
+    """Plain permission errors are not mistaken for rate limiting."""
+
+    assert not GitHubRateLimiter().should_retry(httpx.Response(403))
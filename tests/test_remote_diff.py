@@ -0,0 +1,135 @@
+"""Tests for fetching PR diffs from the GitHub API."""
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from pr_collector import app as app_module
+from pr_collector.app import collect_pr_data, filter_diff_by_dir, get_remote_diff
+
+from .conftest import PR_INFO
+
+SAMPLE_DIFF = """diff --git a/src/app.py b/src/app.py
+index 1111111..2222222 100644
+--- a/src/app.py
++++ b/src/app.py
+@@ -1 +1 @@
+-old
++new
+diff --git a/docs/index.md b/docs/index.md
+index 3333333..4444444 100644
+--- a/docs/index.md
++++ b/docs/index.md
+@@ -1 +1 @@
+-before
++after
+diff --git a/srcs/other.py b/srcs/other.py
+index 5555555..6666666 100644
+--- a/srcs/other.py
++++ b/srcs/other.py
+@@ -1 +1 @@
+-x
++y
+"""
+
+
+def test_filter_diff_by_dir() -> None:
+    """Only file sections under the target directory are kept."""
+
+    filtered = filter_diff_by_dir(SAMPLE_DIFF, "src/")
+
+    assert "src/app.py" in filtered
+    assert "docs/index.md" not in filtered
+    assert "srcs/other.py" not in filtered
+
+
+@pytest.mark.parametrize(
+    ("target_dir", "kept"),
+    [
+        ("./src", ["src/app.py"]),
+        ("src/app.py", ["src/app.py"]),
+        (".", ["src/app.py", "docs/index.md", "srcs/other.py"]),
+    ],
+)
+def test_filter_diff_by_dir_accepts_pathspecs(target_dir: str, kept: list[str]) -> None:
+    """Relative prefixes, single files and "." select the same files git would."""
+
+    filtered = filter_diff_by_dir(SAMPLE_DIFF, target_dir)
+
+    for path in ["src/app.py", "docs/index.md", "srcs/other.py"]:
+        assert (f"diff --git a/{path}" in filtered) == (path in kept)
+
+
+def test_get_remote_diff_requests_diff_media_type(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The PR endpoint is requested with the diff media type and bearer token."""
+
+    captured: dict[str, object] = {}
+
+    def fake_get(url: str, **kwargs: object) -> httpx.Response:
+        captured["url"] = url
+        captured["headers"] = kwargs["headers"]
+        return httpx.Response(200, text=SAMPLE_DIFF, request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(app_module.httpx, "get", fake_get)
+
+    diff = get_remote_diff("owner", "repo", 7, token="secret")
+
+    assert diff == SAMPLE_DIFF.removesuffix("\n")
+    assert captured["url"] == "https://api.github.com/repos/owner/repo/pulls/7"
+    assert captured["headers"] == {
+        "Accept": "application/vnd.github.v3.diff",
+        "Authorization": "Bearer secret",
+    }
+
+
+def test_get_remote_diff_retries_after_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A rate-limited response with Retry-After is retried on the sync path too."""
+
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, text=SAMPLE_DIFF),
+    ]
+    calls: list[str] = []
+
+    def fake_get(url: str, **kwargs: object) -> httpx.Response:
+        calls.append(url)
+        response = responses[len(calls) - 1]
+        response.request = httpx.Request("GET", url)
+        return response
+
+    monkeypatch.setattr(app_module.httpx, "get", fake_get)
+
+    assert get_remote_diff("owner", "repo", 7) == SAMPLE_DIFF.removesuffix("\n")
+    assert len(calls) == 2
+
+
+def test_get_remote_diff_not_found_without_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A 404 without a token suggests providing one."""
+
+    def fake_get(url: str, **kwargs: object) -> httpx.Response:
+        return httpx.Response(404, request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(app_module.httpx, "get", fake_get)
+
+    with pytest.raises(RuntimeError, match="provide a GitHub token"):
+        get_remote_diff("owner", "repo", 7)
+
+
+def test_collect_pr_data_without_local_clone(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A directory that is not a clone uses the API diff, filtered to the target dir."""
+
+    monkeypatch.setattr(app_module, "get_pr_info", lambda *args: PR_INFO)
+    monkeypatch.setattr(app_module, "get_remote_diff", lambda *args: SAMPLE_DIFF)
+
+    output_file, content = collect_pr_data(
+        str(tmp_path), 7, target_dir="docs", repo_url="https://github.com/owner/repo"
+    )
+
+    assert output_file is None
+    assert content is not None
+    assert "docs/index.md" in content
+    assert "src/app.py" not in content
+    assert content.endswith("+after\n```")